@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+from __future__ import print_function
+
+import argparse
+import logging
+import os
+import sys
+import threading
+
+from timeit import default_timer as timer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from binance import jsonlib
+from binance.client import BinanceRESTAPI, BinanceWebSocketAPI
+from mock_server import MockServer, load_payloads
+
+REST_CASES = [
+    ("depth", lambda client, **kwargs: client.depth("BNBBTC", limit=100, **kwargs), BinanceRESTAPI.depth),
+    ("klines", lambda client, **kwargs: client.klines("BNBBTC", "1m", **kwargs), BinanceRESTAPI.klines),
+    ("all_orders", lambda client, **kwargs: client.all_orders("BNBBTC", **kwargs), BinanceRESTAPI.all_orders),
+]
+
+MODES = {
+    "objects": {},
+    "json": {"return_json": True},
+    "raw": {"return_raw": True},
+    "columns": {"return_format": "columns"},
+}
+
+def percentile(samples, q):
+    samples = sorted(samples)
+    return samples[int(q * (len(samples) - 1))]
+
+def object_count(payload):
+    if isinstance(payload, dict):
+        return len(payload.get("bids", [])) + len(payload.get("asks", [])) or 1
+    return len(payload)
+
+def bench_calls(call, requests):
+    call()
+    latencies = []
+    started = timer()
+    for _ in range(requests):
+        call_started = timer()
+        call()
+        latencies.append(timer() - call_started)
+    elapsed = timer() - started
+    return requests / elapsed, percentile(latencies, 0.5), percentile(latencies, 0.99)
+
+def bench_decode(bound, client, body, payload, repeat, **kwargs):
+    method = bound.method_class(client, "BNBBTC", **kwargs)
+    started = timer()
+    for _ in range(repeat):
+        method._decode_response(200, body)
+    return (timer() - started) / repeat / object_count(payload)
+
+def bench_rest(server, requests, modes):
+    client = BinanceRESTAPI("bench", "bench", rate_limiter=None)
+    client.protocol = "http"
+    client.host = server.address
+
+    print("%-12s %-8s %10s %10s %10s %14s" % ("endpoint", "mode", "calls/s", "p50 ms", "p99 ms", "decode us/obj"))
+    for name, call, bound in REST_CASES:
+        for mode in modes:
+            kwargs = MODES[mode]
+            if mode == "columns" and not hasattr(bound.method_class.root_class, "COLUMNS"):
+                continue
+            rate, p50, p99 = bench_calls(lambda: call(client, **kwargs), requests)
+            decode = bench_decode(bound, client, server.bodies[name], server.payloads[name], 50, **kwargs)
+            print("%-12s %-8s %10.0f %10.3f %10.3f %14.3f" % (name, mode, rate, p50 * 1000, p99 * 1000, decode * 1e6))
+    client.close()
+
+def bench_websocket(server, messages, raw=False):
+    ws_client = BinanceWebSocketAPI(reconnect=False, stale_timeout=None)
+    ws_client.protocol = "ws"
+    ws_client.host, ws_client.port = server.server_address
+    ws_client.base_path = "/ws"
+
+    received = [0, None]
+    done = threading.Event()
+
+    def on_message(message):
+        if received[1] is None:
+            received[1] = timer()
+        received[0] += 1
+        if received[0] == messages:
+            done.set()
+
+    server.messages = messages
+    ws_client.depth("BNBBTC", callback=on_message, return_raw=raw, background=True)
+    done.wait(60)
+    elapsed = timer() - received[1] if received[1] is not None else 0
+    ws_client.close(5)
+    print("%-12s %-8s %10.0f msg/s (%d messages)" % ("depth_stream", "raw" if raw else "objects",
+                                                     received[0] / elapsed if elapsed else 0, received[0]))
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the client against a local mock server")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--messages", type=int, default=20000)
+    parser.add_argument("--modes", default="objects,json,raw,columns")
+    parser.add_argument("--payloads", help="directory of recorded <name>.json payloads to replay")
+    parser.add_argument("--json-decoder", help="force a JSON decoder, e.g. json or simplejson")
+    args = parser.parse_args()
+
+    logging.getLogger("websocket").setLevel(logging.CRITICAL)
+    logging.getLogger("binance.stream").setLevel(logging.ERROR)
+
+    if args.json_decoder:
+        jsonlib.set_json_decoder(args.json_decoder)
+    print("json decoder: %s" % jsonlib.decoder_name)
+
+    server = MockServer(payloads=load_payloads(args.payloads)).start()
+    try:
+        bench_rest(server, args.requests, args.modes.split(","))
+        bench_websocket(server, args.messages)
+        bench_websocket(server, args.messages, raw=True)
+    finally:
+        server.stop()
+
+if __name__ == "__main__":
+    main()
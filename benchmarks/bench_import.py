@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+from __future__ import print_function
+
+import argparse
+import os
+import subprocess
+import sys
+
+from timeit import default_timer as timer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ["requests", "websocket", "events", "simplejson", "numpy", "concurrent.futures", "aiohttp"]
+
+TARGETS = [
+    ("binance.client", "None"),
+    ("binance.client", "binance.client.BinanceRESTAPI().session"),
+    ("binance.stream", "None"),
+    ("binance.async_client", "None"),
+]
+
+def cold_start(statement, runs):
+    samples = []
+    for _ in range(runs):
+        started = timer()
+        subprocess.check_call([sys.executable, "-c", statement], cwd=ROOT)
+        samples.append(timer() - started)
+    samples.sort()
+    return samples[len(samples) // 2]
+
+def loaded_modules(module, statement):
+    script = "import sys, %s; %s; print(' '.join(m for m in %r if m in sys.modules))" % (module, statement, HEAVY_MODULES)
+    return subprocess.check_output([sys.executable, "-c", script], cwd=ROOT).decode().strip()
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure cold-start import cost of the client")
+    parser.add_argument("--runs", type=int, default=15)
+    args = parser.parse_args()
+
+    baseline = cold_start("pass", args.runs)
+    print("interpreter start: %.1f ms" % (baseline * 1000))
+    print("%-64s %10s  %s" % ("import", "ms", "heavy modules loaded"))
+    for module, statement in TARGETS:
+        elapsed = cold_start("import %s; %s" % (module, statement), args.runs) - baseline
+        label = module if statement == "None" else "%s; %s" % (module, statement)
+        print("%-64s %10.1f  %s" % (label, elapsed * 1000, loaded_modules(module, statement) or "-"))
+
+if __name__ == "__main__":
+    main()
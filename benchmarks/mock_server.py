@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+import base64
+import hashlib
+import json
+import os
+import socket
+import struct
+import threading
+import time
+
+from six.moves.BaseHTTPServer import HTTPServer, BaseHTTPRequestHandler
+from six.moves.socketserver import ThreadingMixIn
+from six.moves.urllib.parse import urlparse
+
+WEBSOCKET_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+def _price(value):
+    return "%.8f" % value
+
+def depth_payload(levels=100):
+    return {"lastUpdateId": 160,
+            "bids": [[_price(0.0024 - i * 1e-6), _price(10 + i), []] for i in range(levels)],
+            "asks": [[_price(0.0025 + i * 1e-6), _price(12 + i), []] for i in range(levels)]}
+
+def klines_payload(count=500, start_time=1500000000000, interval=60000):
+    return [[start_time + i * interval, "0.00240000", "0.00250000", "0.00230000", "0.00245000", "1523.00000000",
+             start_time + (i + 1) * interval - 1, "3.70412000", 157, "741.00000000", "1.80226000", "0"]
+            for i in range(count)]
+
+def all_orders_payload(count=500):
+    return [{"symbol": "BNBBTC", "orderId": i, "clientOrderId": "myOrder%d" % i, "price": "0.10000000",
+             "origQty": "1.00000000", "executedQty": "0.00000000", "status": "NEW", "timeInForce": "GTC",
+             "type": "LIMIT", "side": "BUY", "stopPrice": "0.00000000", "icebergQty": "0.00000000",
+             "time": 1499827319559 + i} for i in range(count)]
+
+def depth_update_payload(update_id=160, levels=10):
+    return {"e": "depthUpdate", "E": 1499827319559, "s": "BNBBTC", "U": update_id, "u": update_id,
+            "b": [[_price(0.0024 - i * 1e-6), _price(10 + i), []] for i in range(levels)],
+            "a": [[_price(0.0025 + i * 1e-6), _price(12 + i), []] for i in range(levels)]}
+
+DEFAULT_PAYLOADS = {
+    "depth": depth_payload,
+    "klines": klines_payload,
+    "all_orders": all_orders_payload,
+    "depth_update": depth_update_payload,
+}
+
+ROUTES = {
+    "/api/v1/depth": "depth",
+    "/api/v1/klines": "klines",
+    "/api/v3/allOrders": "all_orders",
+}
+
+def load_payloads(directory=None):
+    payloads = {}
+    for name, default in DEFAULT_PAYLOADS.items():
+        path = os.path.join(directory, name + ".json") if directory else None
+        if path and os.path.exists(path):
+            with open(path) as f:
+                payloads[name] = json.load(f)
+        else:
+            payloads[name] = default()
+    return payloads
+
+class MockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, body, status=200):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _respond(self):
+        name = ROUTES.get(urlparse(self.path).path)
+        if name is None:
+            return self._send(b'{"code": -1121, "msg": "Invalid symbol."}', 400)
+        self._send(self.server.bodies[name])
+
+    def _websocket(self):
+        key = self.headers.get("Sec-WebSocket-Key")
+        accept = base64.b64encode(hashlib.sha1((key + WEBSOCKET_GUID).encode()).digest()).decode()
+        self.send_response(101)
+        self.send_header("Upgrade", "websocket")
+        self.send_header("Connection", "Upgrade")
+        self.send_header("Sec-WebSocket-Accept", accept)
+        self.end_headers()
+        self.wfile.flush()
+
+        frame = websocket_frame(self.server.bodies["depth_update"])
+        try:
+            for _ in range(self.server.messages):
+                self.wfile.write(frame)
+            self.wfile.write(websocket_frame(struct.pack("!H", 1000), opcode=0x8))
+            self.wfile.flush()
+            time.sleep(0.5)
+        except socket.error:
+            pass
+        self.close_connection = True
+
+    def do_GET(self):
+        if self.headers.get("Upgrade", "").lower() == "websocket":
+            return self._websocket()
+        self._respond()
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self._respond()
+
+    do_DELETE = do_POST
+
+def websocket_frame(payload, opcode=0x1):
+    length = len(payload)
+    if length < 126:
+        header = struct.pack("!BB", 0x80 | opcode, length)
+    elif length < 65536:
+        header = struct.pack("!BBH", 0x80 | opcode, 126, length)
+    else:
+        header = struct.pack("!BBQ", 0x80 | opcode, 127, length)
+    return header + payload
+
+class MockServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+    def __init__(self, host="127.0.0.1", port=0, payloads=None, messages=10000):
+        HTTPServer.__init__(self, (host, port), MockHandler)
+        self.payloads = payloads or load_payloads()
+        self.bodies = dict([(name, json.dumps(payload).encode()) for name, payload in self.payloads.items()])
+        self.messages = messages
+        self.thread = None
+
+    @property
+    def address(self):
+        return "%s:%s" % self.server_address
+
+    def start(self):
+        self.thread = threading.Thread(target=self.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+import bisect
+
+from .columns import get_numpy
+from .models import to_float
+
+BUY = "BUY"
+SELL = "SELL"
+
+BASIS_POINTS = 10000.0
+
+class DepthSide(object):
+    def __init__(self, levels, descending=False):
+        self.descending = descending
+        self.keys = []
+        self.prices = []
+        self.cum_qty = []
+        self.cum_notional = []
+        self._arrays = None
+
+        total_qty = total_notional = 0.0
+        for level in levels:
+            price, qty = to_float(level.price), to_float(level.qty)
+            if qty <= 0:
+                continue
+            total_qty += qty
+            total_notional += price * qty
+            self.keys.append(-price if descending else price)
+            self.prices.append(price)
+            self.cum_qty.append(total_qty)
+            self.cum_notional.append(total_notional)
+
+    def __len__(self):
+        return len(self.prices)
+
+    def best(self):
+        return self.prices[0] if self.prices else None
+
+    def cumulative(self, index):
+        if index <= 0:
+            return 0.0, 0.0
+        return self.cum_qty[index - 1], self.cum_notional[index - 1]
+
+    def fill(self, quantity):
+        index = bisect.bisect_left(self.cum_qty, quantity)
+        if quantity <= 0 or index == len(self.cum_qty):
+            return None
+        filled_qty, filled_notional = self.cumulative(index)
+        return (filled_notional + (quantity - filled_qty) * self.prices[index]) / quantity
+
+    def _numpy_arrays(self, numpy):
+        if self._arrays is None:
+            self._arrays = (numpy.array(self.prices, dtype="float64"),
+                            numpy.array(self.cum_qty, dtype="float64"),
+                            numpy.array(self.cum_notional, dtype="float64"))
+        return self._arrays
+
+    def fill_many(self, quantities):
+        numpy = get_numpy()
+        if numpy is None or not self.prices:
+            return [self.fill(quantity) for quantity in quantities]
+
+        prices, cum_qty, cum_notional = self._numpy_arrays(numpy)
+        quantities = numpy.asarray(quantities, dtype="float64")
+        indexes = numpy.searchsorted(cum_qty, quantities, side="left")
+        valid = (indexes < len(cum_qty)) & (quantities > 0)
+        indexes = numpy.minimum(indexes, len(cum_qty) - 1)
+        previous = numpy.maximum(indexes - 1, 0)
+        filled_qty = numpy.where(indexes > 0, cum_qty[previous], 0.0)
+        filled_notional = numpy.where(indexes > 0, cum_notional[previous], 0.0)
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            vwap = (filled_notional + (quantities - filled_qty) * prices[indexes]) / quantities
+        return [price if ok else None for price, ok in zip(vwap.tolist(), valid.tolist())]
+
+    def within(self, price):
+        index = bisect.bisect_right(self.keys, -price if self.descending else price)
+        return self.cumulative(index)
+
+    def top(self, levels):
+        return self.cumulative(min(levels, len(self.prices)))
+
+class DepthAnalytics(object):
+    def __init__(self, depth):
+        self.bids = DepthSide(depth.bids, descending=True)
+        self.asks = DepthSide(depth.asks)
+
+    def _side(self, side):
+        side = side.upper()
+        if side == BUY:
+            return self.asks
+        elif side == SELL:
+            return self.bids
+        raise ValueError("side must be %s or %s, got %r" % (BUY, SELL, side))
+
+    def best_bid(self):
+        return self.bids.best()
+
+    def best_ask(self):
+        return self.asks.best()
+
+    def mid_price(self):
+        if not self.bids or not self.asks:
+            return None
+        return (self.bids.best() + self.asks.best()) / 2
+
+    def spread(self):
+        if not self.bids or not self.asks:
+            return None
+        return self.asks.best() - self.bids.best()
+
+    def vwap(self, side, quantity):
+        book_side = self._side(side)
+        if hasattr(quantity, "__iter__"):
+            return book_side.fill_many(quantity)
+        return book_side.fill(quantity)
+
+    def slippage(self, side, quantity):
+        mid_price = self.mid_price()
+        if mid_price is None:
+            return None
+        sign = 1 if side.upper() == BUY else -1
+
+        vwap = self.vwap(side, quantity)
+        if isinstance(vwap, list):
+            return [None if price is None else sign * (price / mid_price - 1) * BASIS_POINTS for price in vwap]
+        if vwap is None:
+            return None
+        return sign * (vwap / mid_price - 1) * BASIS_POINTS
+
+    def liquidity_within(self, bps):
+        mid_price = self.mid_price()
+        if mid_price is None:
+            return None
+        bid_qty, bid_notional = self.bids.within(mid_price * (1 - bps / BASIS_POINTS))
+        ask_qty, ask_notional = self.asks.within(mid_price * (1 + bps / BASIS_POINTS))
+        return {
+            "bids": {"base": bid_notional, "qty": bid_qty},
+            "asks": {"base": ask_notional, "qty": ask_qty},
+        }
+
+    def imbalance(self, levels=None, bps=None):
+        if bps is not None:
+            liquidity = self.liquidity_within(bps)
+            if liquidity is None:
+                return None
+            bid_qty, ask_qty = liquidity["bids"]["qty"], liquidity["asks"]["qty"]
+        elif levels is not None:
+            bid_qty, ask_qty = self.bids.top(levels)[0], self.asks.top(levels)[0]
+        else:
+            bid_qty, ask_qty = self.bids.top(len(self.bids))[0], self.asks.top(len(self.asks))[0]
+
+        if bid_qty + ask_qty == 0:
+            return None
+        return (bid_qty - ask_qty) / (bid_qty + ask_qty)
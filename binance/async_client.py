@@ -0,0 +1,195 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+import asyncio
+import time
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from timeit import default_timer as timer
+
+from .batch import BatchResult, BatchResults
+from .bind import BinanceClientError
+from .client import BinanceRESTAPI
+from .clock import ServerClock, logger as clock_logger
+
+class AsyncServerClock(ServerClock):
+    def __init__(self, api, smoothing=0.3):
+        super(AsyncServerClock, self).__init__(api, smoothing)
+        self._task = None
+
+    async def sync(self):
+        sent = time.time()
+        server_time = (await self.api.server_time(return_json=True, cache=False))["serverTime"]
+        return self.record(sent, server_time, time.time())
+
+    async def _refresh(self, interval):
+        while True:
+            try:
+                await self.sync()
+            except Exception as e:
+                clock_logger.warning("Server time sync failed: %s", e)
+            await asyncio.sleep(interval)
+
+    def start(self, interval=60):
+        self.stop()
+        self._task = asyncio.ensure_future(self._refresh(interval))
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+class AsyncRequest(object):
+    def __init__(self, api):
+        self.api = api
+
+    async def make_request(self, url, method="GET", body=None, headers=None, weight=1, orders=0, timings=None):
+        headers = headers or {}
+        if not 'User-Agent' in headers:
+            headers.update({"User-Agent": "%s Python Client" % self.api.api_name})
+        rate_limiter = self.api.rate_limiter
+        if rate_limiter is not None:
+            started = timer()
+            wait = rate_limiter.reserve(weight, orders)
+            if wait > 0:
+                await asyncio.sleep(wait)
+            if timings is not None:
+                timings["rate_limit"] = timer() - started
+
+        started = timer()
+        session = await self.api.get_session()
+        async with session.request(method, url, data=body, headers=headers) as response:
+            content = await response.read()
+            if timings is not None:
+                timings["network"] = timer() - started
+            if rate_limiter is not None:
+                rate_limiter.update(response.status, response.headers)
+            self.api.clock.update_from_date(response.headers.get("Date"))
+            return response.status, content
+
+def bind_async_method(method_class):
+
+    async def _call(api, *args, **kwargs):
+        metrics = api.metrics
+        started = timer()
+        method = method_class(api, *args, **kwargs)
+        method.timings["build"] = timer() - started - method.timings.get("sign", 0)
+        url, http_method, body, headers = method.prepare_request()
+        headers = method._build_headers(headers)
+
+        try:
+            status_code, content = await AsyncRequest(api).make_request(url, http_method, body, headers,
+                                                                        weight=method._request_weight(),
+                                                                        orders=method._request_orders(),
+                                                                        timings=method.timings)
+        except Exception:
+            if metrics is not None:
+                metrics.increment("request_errors_total", endpoint=method.path)
+            raise
+        decode_started = timer()
+
+        try:
+            return method._decode_response(status_code, content)
+        finally:
+            if metrics is not None:
+                method.timings["decode"] = timer() - decode_started
+                metrics.record_request(method.path, method.timings, status_code, len(content))
+
+    _call.method_class = method_class
+    return _call
+
+async def _run(semaphore, method, index, params):
+    async with semaphore:
+        try:
+            if isinstance(params, dict):
+                result = await method(**params)
+            else:
+                result = await method(*params)
+        except Exception as e:
+            return BatchResult(index, params, error=e)
+    return BatchResult(index, params, result=result)
+
+class AsyncBinanceRESTAPI(BinanceRESTAPI):
+
+    def __init__(self, api_key=None, secret_key=None, limit=100, limit_per_host=0,
+                 keepalive_timeout=15, timeout=10, rate_limiter=True, metrics=None):
+        if aiohttp is None:
+            raise BinanceClientError("aiohttp is required for AsyncBinanceRESTAPI")
+        super(AsyncBinanceRESTAPI, self).__init__(api_key, secret_key, timeout=timeout, rate_limiter=rate_limiter,
+                                                  metrics=metrics)
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.clock = AsyncServerClock(self)
+        self._async_session = None
+        self._async_session_lock = None
+
+    @property
+    def session(self):
+        raise BinanceClientError("AsyncBinanceRESTAPI has no requests session, use await get_session()")
+
+    def __enter__(self):
+        raise TypeError("Use 'async with' with AsyncBinanceRESTAPI")
+
+    def __exit__(self, *args):
+        pass
+
+    def _batch(self, method, params_list, max_workers):
+        semaphore = asyncio.Semaphore(max_workers or self.limit or 100)
+        return [_run(semaphore, method, index, params) for index, params in enumerate(params_list)]
+
+    async def batch(self, method, params_list, max_workers=None):
+        return BatchResults(await asyncio.gather(*self._batch(method, params_list, max_workers)))
+
+    def batch_as_completed(self, method, params_list, max_workers=None):
+        return asyncio.as_completed(self._batch(method, params_list, max_workers))
+
+    def iter_klines(self, *args, **kwargs):
+        raise BinanceClientError("iter_klines is not supported by AsyncBinanceRESTAPI, use batch over klines windows")
+
+    def iter_aggregate_trades(self, *args, **kwargs):
+        raise BinanceClientError("iter_aggregate_trades is not supported by AsyncBinanceRESTAPI, "
+                                 "use batch over aggregate_trades windows")
+
+    def _client_timeout(self):
+        if isinstance(self.timeout, tuple):
+            return aiohttp.ClientTimeout(sock_connect=self.timeout[0], sock_read=self.timeout[1])
+        return aiohttp.ClientTimeout(total=self.timeout)
+
+    async def get_session(self):
+        if self._async_session is None:
+            if self._async_session_lock is None:
+                self._async_session_lock = asyncio.Lock()
+            async with self._async_session_lock:
+                if self._async_session is None:
+                    connector = aiohttp.TCPConnector(limit=self.limit,
+                                                     limit_per_host=self.limit_per_host,
+                                                     keepalive_timeout=self.keepalive_timeout)
+                    self._async_session = aiohttp.ClientSession(connector=connector,
+                                                                timeout=self._client_timeout())
+        return self._async_session
+
+    async def sync_clock(self):
+        sent = time.time()
+        server_time = (await self.server_time(return_json=True, cache=False))["serverTime"]
+        return self.clock.record(sent, server_time, time.time())
+
+    async def close(self):
+        self.clock.stop()
+        if self._async_session is not None:
+            await self._async_session.close()
+            self._async_session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+for _name, _value in list(vars(BinanceRESTAPI).items()):
+    if hasattr(_value, "method_class"):
+        setattr(AsyncBinanceRESTAPI, _name, bind_async_method(_value.method_class))
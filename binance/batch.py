@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+import collections
+import itertools
+
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+class BatchResult(object):
+    def __init__(self, index, params, result=None, error=None):
+        self.index = index
+        self.params = params
+        self.result = result
+        self.error = error
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    def __repr__(self):
+        if self.ok:
+            return "BatchResult(%s, %r)" % (self.index, self.result)
+        return "BatchResult(%s, error=%r)" % (self.index, self.error)
+
+class BatchResults(list):
+
+    @property
+    def successes(self):
+        return [item for item in self if item.ok]
+
+    @property
+    def errors(self):
+        return [item for item in self if not item.ok]
+
+    @property
+    def results(self):
+        return [item.result for item in self if item.ok]
+
+def _run(method, index, params):
+    try:
+        if isinstance(params, dict):
+            result = method(**params)
+        else:
+            result = method(*params)
+    except Exception as e:
+        return BatchResult(index, params, error=e)
+    return BatchResult(index, params, result=result)
+
+def iter_batch(method, params_list, max_workers=8, ordered=True):
+    params_iter = enumerate(params_list)
+    window = max_workers * 2
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    def submit(count):
+        return [executor.submit(_run, method, index, params)
+                for index, params in itertools.islice(params_iter, count)]
+
+    pending = collections.deque(submit(window))
+    try:
+        if ordered:
+            while pending:
+                item = pending.popleft().result()
+                pending.extend(submit(1))
+                yield item
+        else:
+            pending = set(pending)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                pending.update(submit(len(done)))
+                for future in done:
+                    yield future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+def run_batch(method, params_list, max_workers=8):
+    return BatchResults(iter_batch(method, params_list, max_workers=max_workers))
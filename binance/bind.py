@@ -3,23 +3,50 @@
 
 import re
 import six
-import hmac
-import time
 
-from .request import Request, WebSocket
-from hashlib import sha256
+from . import jsonlib
+from .columns import columns_from_list
+from .models import LazyList
+from .request import Request
+from .event_queue import EventQueue, DROP_OLDEST
+from .metrics import response_retries
+from timeit import default_timer as timer
+from six.moves.urllib.parse import quote_plus
 
 re_path_template = re.compile('{\w+}')
+re_unsafe_query = re.compile('[^A-Za-z0-9_.~-]')
+
+WEBSOCKET_HOOKS = ["on_open", "on_close", "on_reconnect", "on_error"]
+
+_camel_cache = {}
 
 def underline_to_camel(underline_format):
+    camel_format = _camel_cache.get(underline_format)
+    if camel_format is not None:
+        return camel_format
+
     camel_format = ''
     if isinstance(underline_format, str):
         splits = underline_format.split('_')
         camel_format += splits[0]
         for _s_ in splits[1:]:
             camel_format += _s_.capitalize()
+        _camel_cache[underline_format] = camel_format
     return camel_format
 
+def _quote(value):
+    return quote_plus(value) if re_unsafe_query.search(value) else value
+
+def encode_parameters(parameters):
+    return "&".join([_quote(key) + "=" + _quote(value) for key, value in parameters.items()])
+
+def sign(api, payload):
+    if api.signer is None:
+        raise BinanceClientError("secret_key is required for signed requests")
+    signer = api.signer.copy()
+    signer.update(payload.encode())
+    return signer.hexdigest()
+
 class BinanceClientError(Exception):
     def __init__(self, error_message, status_code=None):
         self.status_code = status_code
@@ -61,6 +88,14 @@ def bind_method(**config):
         def __init__(self, api, *args, **kwargs):
             self.api = api
             self.return_json = kwargs.pop("return_json", False)
+            self.return_raw = kwargs.pop("return_raw", False)
+            self.return_format = kwargs.pop("return_format", None)
+            self.use_cache = kwargs.pop("cache", True)
+            if self.return_format == "columns" and not hasattr(self.root_class, "COLUMNS"):
+                raise BinanceClientError("return_format='columns' is not supported for %s" % self.path)
+            if self.return_format == "lazy" and self.response_type != "list":
+                raise BinanceClientError("return_format='lazy' is not supported for %s" % self.path)
+            self.timings = {}
             self.parameters = {}
             self._build_parameters(args, kwargs)
 
@@ -83,29 +118,31 @@ def bind_method(**config):
                 self.parameters[key] = str(value)
 
             if "timestamp" in self.accepts_parameters and "timestamp" not in self.parameters:
-                self.parameters["timestamp"] = int(time.time() * 1000)
+                self.parameters["timestamp"] = str(self.api.clock.now())
 
+            self.query = encode_parameters(self.parameters)
             if self.signature and self.api.api_key != None:
-                signature_parameters_string = \
-                    "&".join(["%s=%s" % (key, value) for key, value in self.parameters.items()])
-                self.parameters["signature"] = hmac.new(self.api.secret_key.encode(), signature_parameters_string.encode(), sha256).hexdigest()
+                started = timer()
+                self.query += ("&" if self.query else "") + "signature=" + sign(self.api, self.query)
+                self.timings["sign"] = timer() - started
 
-        def _do_api_request(self, url, method="GET", body=None, headers=None):
+        def _build_headers(self, headers=None):
             headers = headers or {}
             if self.signature and self.api.api_key != None or self.api_key_required:
                 headers["X-MBX-APIKEY"] = self.api.api_key
+            return headers
 
-            response = Request(self.api).make_request(url, method=method, body=body, headers=headers)
-            try:
-                content_obj = response.json()
-            except ValueError:
-                raise BinanceClientError('Unable to parse response, not valid JSON.', status_code=response.status_code)
-
-            if "code" in content_obj and "msg" in content_obj:
-                raise BinanceAPIError(response.status_code, content_obj["code"], content_obj["msg"])
+        def _build_response(self, status_code, content_obj):
+            if isinstance(content_obj, dict) and "code" in content_obj and "msg" in content_obj:
+                raise BinanceAPIError(status_code, content_obj["code"], content_obj["msg"])
 
             api_responses = []
 
+            if self.return_format == "columns":
+                return columns_from_list(content_obj, self.root_class.COLUMNS)
+            elif self.return_format == "lazy":
+                return LazyList(content_obj, self.root_class)
+
             if self.response_type == "list":
                 for entry in content_obj:
                     if self.return_json:
@@ -122,18 +159,83 @@ def bind_method(**config):
                 api_responses = {}
 
             return api_responses
-                    
+
+        def _request_weight(self):
+            weight = config.get("weight", 1)
+            return weight(self.parameters) if callable(weight) else weight
+
+        def _request_orders(self):
+            return config.get("orders", 0)
+
+        def _cache_ttl(self):
+            cache = self.api.cache
+            if cache is None or not self.use_cache or self.method != "GET":
+                return None
+            return cache.ttl(self.path, config.get("cache_ttl"))
+
+        def _make_request(self, url, method, body, headers):
+            request = lambda: Request(self.api).make_request(url, method=method, body=body, headers=headers,
+                                                             weight=self._request_weight(),
+                                                             orders=self._request_orders(),
+                                                             timings=self.timings)
+            ttl = self._cache_ttl()
+            if not ttl:
+                return request()
+            return self.api.cache.get((self.method, self.path, self.query), ttl, request,
+                                      cacheable=lambda response: response.status_code == 200)
+
+        def _decode_response(self, status_code, content):
+            if self.return_raw:
+                return content
+
+            try:
+                content_obj = jsonlib.loads(content)
+            except ValueError:
+                raise BinanceClientError('Unable to parse response, not valid JSON.', status_code=status_code)
+
+            return self._build_response(status_code, content_obj)
+
+        def _do_api_request(self, url, method="GET", body=None, headers=None):
+            headers = self._build_headers(headers)
+            metrics = self.api.metrics
+
+            started = timer()
+            try:
+                response = self._make_request(url, method, body, headers)
+            except Exception:
+                if metrics is not None:
+                    metrics.increment("request_errors_total", endpoint=self.path)
+                raise
+            decode_started = timer()
+            cached = "network" not in self.timings
+            if cached:
+                self.timings["cache"] = decode_started - started
+
+            try:
+                return self._decode_response(response.status_code, response.content)
+            finally:
+                if metrics is not None:
+                    self.timings["decode"] = timer() - decode_started
+                    metrics.record_request(self.path, self.timings, response.status_code,
+                                           len(response.content), response_retries(response), cached=cached)
+
+        def prepare_request(self):
+            return Request(self.api).prepare_encoded_request(self.method,
+                                                             self.path,
+                                                             self.query)
+
         def execute(self):
-            url, method, body, headers = Request(self.api).prepare_request(self.method,
-                                                                           self.path,
-                                                                           self.parameters)
+            url, method, body, headers = self.prepare_request()
             content = self._do_api_request(url, method, body, headers)
             return content
 
     def _call(api, *args, **kwargs):
+        started = timer()
         method = BinanceAPIMethod(api, *args, **kwargs)
+        method.timings["build"] = timer() - started - method.timings.get("sign", 0)
         return method.execute()
 
+    _call.method_class = BinanceAPIMethod
     return _call
 
 def bind_ws_method(**config):
@@ -147,7 +249,21 @@ def bind_ws_method(**config):
         def __init__(self, api, *args, **kwargs):
             self.api = api
             self.callback = kwargs.pop("callback", None)
+            self.queue = kwargs.pop("queue", None)
+            queue_size = kwargs.pop("queue_size", 10000)
+            overflow = kwargs.pop("overflow", DROP_OLDEST)
+            if self.queue is True:
+                self.queue = EventQueue(queue_size, overflow)
+            if self.queue is not None:
+                if self.callback is not None:
+                    raise BinanceWebSocketClientError("Use either callback or queue, not both")
+                self.callback = self.queue.put
             self.return_json = kwargs.pop("return_json", False)
+            self.return_raw = kwargs.pop("return_raw", False)
+            self.background = kwargs.pop("background", False)
+            self.data_timeout = kwargs.pop("data_timeout", None)
+            self.hooks = dict([(name, kwargs.pop(name, None)) for name in WEBSOCKET_HOOKS])
+            self.websocket = None
             self.parameters = {}
             self._build_parameters(args, kwargs)
             self._build_path()
@@ -181,7 +297,23 @@ def bind_ws_method(**config):
                 
                 self.path = self.path.replace(variable, value)
 
+        @property
+        def stream_name(self):
+            return self.path.lstrip("/")
+
+        def _record_message(self, event_time=None):
+            received = self.websocket.last_message_time if self.websocket is not None else None
+            self.api.metrics.record_message(self.stream_name, event_time, received)
+
+        def _raw_callback(self, message):
+            if self.api.metrics is not None:
+                self._record_message()
+            self.callback(message)
+
         def _callback(self, content_obj):
+            if self.api.metrics is not None:
+                self._record_message(content_obj.get("E") if isinstance(content_obj, dict) else None)
+
             api_responses = []
             if self.response_type == "list":
                 for entry in content_obj:
@@ -200,15 +332,33 @@ def bind_ws_method(**config):
 
             self.callback(api_responses)
             
-        def _run_subscribe(self, url):
-            WebSocket(self.api, self._callback).run_forever(url)
+        @property
+        def message_counts(self):
+            return {self.stream_name: self.websocket.message_count if self.websocket else 0}
+
+        def close(self):
+            if self.websocket is not None:
+                self.websocket.close()
+
+        def run_forever(self):
+            url = self.websocket.prepare_request(self.path)
+            self.websocket.run_forever(url)
                     
         def execute(self):
-            url = WebSocket(self.api).prepare_request(self.path)
-            self._run_subscribe(url)
+            from .stream import WebSocket, Subscription
+
+            if self.return_raw:
+                self.websocket = WebSocket(self.api, self._raw_callback, raw=True, data_timeout=self.data_timeout,
+                                           **self.hooks)
+            else:
+                self.websocket = WebSocket(self.api, self._callback, data_timeout=self.data_timeout, **self.hooks)
+            if self.background:
+                return Subscription(self.api, self).start()
+            self.run_forever()
 
     def _subscribe(api, *args, **kwargs):
         method = BinanceWebSocketAPIMethod(api, *args, **kwargs)
         return method.execute()
 
+    _subscribe.method_class = BinanceWebSocketAPIMethod
     return _subscribe
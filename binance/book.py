@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+import logging
+import threading
+import time
+
+from functools import partial
+
+from .models import OrderBook
+
+logger = logging.getLogger(__name__)
+
+class OrderBookManager(object):
+    def __init__(self, rest_client, ws_client, symbols=None, limit=1000, callback=None,
+                 on_resync=None, retry_interval=1, **hooks):
+        self.rest_client = rest_client
+        self.ws_client = ws_client
+        self.limit = limit
+        self.callback = callback
+        self.on_resync = on_resync
+        self.retry_interval = retry_interval
+        self.stream = ws_client.combined_stream(**hooks)
+        self.books = {}
+        self.resyncs = {}
+        self._buffers = {}
+        self._synced = {}
+        self._syncing = set()
+        self._streams = {}
+        self._lock = threading.RLock()
+        for symbol in symbols or []:
+            self.add(symbol)
+
+    def add(self, symbol):
+        symbol = symbol.upper()
+        with self._lock:
+            if symbol in self.books:
+                return self.books[symbol]
+            book = self.books[symbol] = OrderBook(symbol=symbol)
+            self.resyncs[symbol] = 0
+            self._buffers[symbol] = []
+            self._synced[symbol] = False
+        self._streams[symbol] = self.stream.subscribe(self.ws_client.depth, symbol,
+                                                      callback=partial(self._on_delta, symbol))
+        return book
+
+    def remove(self, symbol):
+        symbol = symbol.upper()
+        with self._lock:
+            self.books.pop(symbol)
+            self._buffers.pop(symbol, None)
+            self._synced.pop(symbol, None)
+            self.resyncs.pop(symbol, None)
+        self.stream.unsubscribe(self._streams.pop(symbol))
+
+    def get(self, symbol):
+        return self.books.get(symbol.upper())
+
+    def is_synced(self, symbol):
+        return self._synced.get(symbol.upper(), False)
+
+    def _start_sync(self, symbol):
+        with self._lock:
+            if symbol in self._syncing:
+                return
+            self._syncing.add(symbol)
+        thread = threading.Thread(target=self._sync, args=(symbol,))
+        thread.daemon = True
+        thread.start()
+
+    def _sync(self, symbol):
+        try:
+            while symbol in self.books:
+                try:
+                    depth = self.rest_client.depth(symbol, self.limit)
+                except Exception as e:
+                    logger.warning("Depth snapshot for %s failed: %s", symbol, e)
+                    time.sleep(self.retry_interval)
+                    continue
+
+                with self._lock:
+                    book = self.books.get(symbol)
+                    if book is None:
+                        return
+                    synced = self._align(symbol, depth)
+
+                if synced:
+                    if self.callback is not None:
+                        self.callback(book)
+                    return
+                time.sleep(self.retry_interval)
+        finally:
+            with self._lock:
+                self._syncing.discard(symbol)
+
+    def _align(self, symbol, depth):
+        if not self._buffers[symbol]:
+            return False
+
+        book = self.books[symbol]
+        buffered = [delta for delta in self._buffers[symbol] if delta.update_id > depth.last_update_id]
+        first = buffered[0] if buffered else None
+        if first is not None and first.first_update_id is not None \
+                and first.first_update_id > depth.last_update_id + 1:
+            logger.info("Depth snapshot for %s is older than buffered events, refetching", symbol)
+            return False
+
+        book.load(depth)
+        for delta in buffered:
+            if not self._is_next(book, delta):
+                logger.info("Gap in buffered depth events for %s, refetching", symbol)
+                return False
+            book.apply(delta)
+
+        self._buffers[symbol] = []
+        self._synced[symbol] = True
+        return True
+
+    def _is_next(self, book, delta):
+        if delta.first_update_id is None:
+            return delta.update_id > book.last_update_id
+        return delta.first_update_id <= book.last_update_id + 1 <= delta.update_id
+
+    def _resync(self, symbol, delta):
+        logger.warning("Gap in depth stream for %s after %s, resyncing", symbol, self.books[symbol].last_update_id)
+        self._synced[symbol] = False
+        self._buffers[symbol] = [delta]
+        self.resyncs[symbol] += 1
+        if self.on_resync is not None:
+            self.on_resync(symbol)
+        self._start_sync(symbol)
+
+    def _on_delta(self, symbol, delta):
+        with self._lock:
+            book = self.books.get(symbol)
+            if book is None:
+                return
+
+            if not self._synced[symbol]:
+                self._buffers[symbol].append(delta)
+                self._start_sync(symbol)
+                return
+
+            if delta.update_id <= book.last_update_id:
+                return
+
+            if not self._is_next(book, delta):
+                self._resync(symbol, delta)
+                return
+
+            book.apply(delta)
+
+        if self.callback is not None:
+            self.callback(book)
+
+    def close(self):
+        self.stream.close()
+
+    def start(self):
+        return self.stream.start()
+
+    def run_forever(self):
+        self.stream.run_forever()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+import collections
+import threading
+import time
+
+from .bind import BinanceClientError
+
+class _Flight(object):
+    def __init__(self):
+        self.event = threading.Event()
+        self.done = False
+        self.result = None
+        self.error = None
+
+class ResponseCache(object):
+    def __init__(self, maxsize=1024, ttls=None):
+        self.maxsize = maxsize
+        self.ttls = dict(ttls or {})
+        self.entries = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self._flights = {}
+        self._lock = threading.Lock()
+
+    def ttl(self, path, default=None):
+        return self.ttls.get(path, default)
+
+    def _purge(self, now):
+        expired = [key for key, (expires, value) in self.entries.items() if expires <= now]
+        for key in expired:
+            del self.entries[key]
+        self.evictions += len(expired)
+
+    def _store(self, key, value, ttl, now):
+        self.entries.pop(key, None)
+        if len(self.entries) >= self.maxsize:
+            self._purge(now)
+        while len(self.entries) >= self.maxsize:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+        self.entries[key] = (now + ttl, value)
+
+    def get(self, key, ttl, fetch, cacheable=None):
+        with self._lock:
+            now = time.time()
+            entry = self.entries.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self.hits += 1
+                    return entry[1]
+                del self.entries[key]
+                self.evictions += 1
+
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                self.misses += 1
+                flight = self._flights[key] = _Flight()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            flight.event.wait()
+            if not flight.done:
+                raise flight.error or BinanceClientError("Coalesced request for %r was interrupted" % (key,))
+            return flight.result
+
+        try:
+            flight.result = fetch()
+            flight.done = True
+            return flight.result
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                if flight.done and (cacheable is None or cacheable(flight.result)):
+                    self._store(key, flight.result, ttl, time.time())
+                del self._flights[key]
+            flight.event.set()
+
+    def purge(self):
+        with self._lock:
+            self._purge(time.time())
+
+    def clear(self):
+        with self._lock:
+            self.entries.clear()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __repr__(self):
+        return "ResponseCache(size=%d, hits=%d, misses=%d, coalesced=%d, evictions=%d)" % (
+            len(self.entries), self.hits, self.misses, self.coalesced, self.evictions)
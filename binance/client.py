@@ -1,20 +1,39 @@
 #!/usr/bin/env python
 # coding=utf-8
 
+import hmac
 import time
 import six
+import threading
 
 if six.PY3:
     import _thread as thread
 else:
     import thread
 
+from hashlib import sha256
+
 from .bind import bind_method, bind_ws_method
+from .request import create_session
+from .ratelimit import RateLimiter
+from .cache import ResponseCache
+from .clock import ServerClock
 from .models import Entry, Depth, Trade, AggregateTrade, Candlestick, Statistics, Price, Ticker, Order, Account, \
                     Deposit, Withdraw, DepthUpdateEvent, KLineEvent, AggregateTradeEvent, UserDataEvent
 
 NO_ACCEPT_PARAMETERS = []
 
+def depth_weight(parameters):
+    limit = int(parameters.get("limit", 100))
+    if limit <= 100:
+        return 1
+    elif limit <= 500:
+        return 5
+    return 10
+
+def symbol_weight(weight_with_symbol, weight_without_symbol):
+    return lambda parameters: weight_with_symbol if "symbol" in parameters else weight_without_symbol
+
 class BinanceRESTAPI(object):
     host = "www.binance.com"
     base_path = "/api"
@@ -22,9 +41,73 @@ class BinanceRESTAPI(object):
     protocol = "https"
     api_name = "Binance"
 
-    def __init__(self, api_key=None, secret_key=None):
+    def __init__(self, api_key=None, secret_key=None, pool_connections=10, pool_maxsize=10,
+                 keep_alive=True, timeout=10, max_retries=0, rate_limiter=True, clock_refresh_interval=None,
+                 metrics=None, cache=None):
         self.api_key = api_key
         self.secret_key = secret_key
+        self.metrics = metrics
+        self.clock = ServerClock(self)
+        self.rate_limiter = RateLimiter() if rate_limiter is True else rate_limiter or None
+        self.cache = ResponseCache() if cache is True else None if cache is False else cache
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self._session = None
+        self._session_lock = threading.Lock()
+        if clock_refresh_interval:
+            self.clock.start(clock_refresh_interval)
+
+    @property
+    def secret_key(self):
+        return self._secret_key
+
+    @secret_key.setter
+    def secret_key(self, secret_key):
+        self._secret_key = secret_key
+        self.signer = hmac.new(secret_key.encode(), digestmod=sha256) if secret_key else None
+
+    @property
+    def session(self):
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = create_session(pool_connections=self.pool_connections,
+                                                   pool_maxsize=self.pool_maxsize,
+                                                   max_retries=self.max_retries,
+                                                   keep_alive=self.keep_alive)
+        return self._session
+
+    def close(self):
+        self.clock.stop()
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def batch(self, method, params_list, max_workers=None):
+        from .batch import run_batch
+        return run_batch(method, params_list, max_workers=max_workers or self.pool_maxsize)
+
+    def batch_as_completed(self, method, params_list, max_workers=None):
+        from .batch import iter_batch
+        return iter_batch(method, params_list, max_workers=max_workers or self.pool_maxsize, ordered=False)
+
+    def iter_klines(self, symbol, interval, start_time, end_time=None, **kwargs):
+        from .paginate import iter_klines
+        return iter_klines(self, symbol, interval, start_time, end_time, **kwargs)
+
+    def iter_aggregate_trades(self, symbol, start_time, end_time=None, **kwargs):
+        from .paginate import iter_aggregate_trades
+        return iter_aggregate_trades(self, symbol, start_time, end_time, **kwargs)
 
     ping = bind_method(
             path="/v1/ping",
@@ -36,6 +119,7 @@ class BinanceRESTAPI(object):
             path="/v1/time",
             method="GET",
             accepts_parameters=NO_ACCEPT_PARAMETERS,
+            cache_ttl=1,
             response_type="entry",
             root_class=Entry)
 
@@ -43,6 +127,7 @@ class BinanceRESTAPI(object):
             path="/v1/depth",
             method="GET",
             accepts_parameters=["symbol", "limit"],
+            weight=depth_weight,
             response_type="entry",
             root_class=Depth)
 
@@ -64,6 +149,8 @@ class BinanceRESTAPI(object):
             path="/v1/ticker/24hr",
             method="GET",
             accepts_parameters=["symbol"],
+            weight=symbol_weight(1, 40),
+            cache_ttl=5,
             response_type="entry",
             root_class=Statistics)
 
@@ -71,6 +158,8 @@ class BinanceRESTAPI(object):
             path="/v1/ticker/allPrices",
             method="GET",
             accepts_parameters=NO_ACCEPT_PARAMETERS,
+            weight=2,
+            cache_ttl=1,
             response_type="list",
             root_class=Price)
 
@@ -78,6 +167,8 @@ class BinanceRESTAPI(object):
             path="/v1/ticker/allBookTickers",
             method="GET",
             accepts_parameters=NO_ACCEPT_PARAMETERS,
+            weight=2,
+            cache_ttl=1,
             response_type="list",
             root_class=Ticker)
 
@@ -86,6 +177,7 @@ class BinanceRESTAPI(object):
             method="POST",
             accepts_parameters=["symbol", "side", "type", "time_in_force", "quantity", "price", "new_client_order_id", "stop_price", "iceberg_qty", "timestamp"],
             signature=True,
+            orders=1,
             response_type="entry",
             root_class=Order)
 
@@ -117,6 +209,7 @@ class BinanceRESTAPI(object):
             method="GET",
             accepts_parameters=["symbol", "recv_window", "timestamp"],
             signature=True,
+            weight=symbol_weight(1, 40),
             response_type="list",
             root_class=Order)
 
@@ -125,6 +218,7 @@ class BinanceRESTAPI(object):
             method="GET",
             accepts_parameters=["symbol", "order_id", "limit", "recv_window", "timestamp"],
             signature=True,
+            weight=5,
             response_type="list",
             root_class=Order)
 
@@ -133,6 +227,7 @@ class BinanceRESTAPI(object):
             method="GET",
             accepts_parameters=["recv_window", "timestamp"],
             signature=True,
+            weight=5,
             response_type="entry",
             root_class=Account)
 
@@ -141,6 +236,7 @@ class BinanceRESTAPI(object):
             method="GET",
             accepts_parameters=["symbol", "limit", "from_id", "recv_window", "timestamp"],
             signature=True,
+            weight=5,
             response_type="list",
             root_class=Trade)
 
@@ -195,11 +291,47 @@ class BinanceWebSocketAPI(object):
     port = "9443"
     protocol = "wss"
     base_path = "/ws"
+    combined_base_path = "/stream"
     
-    def __init__(self, api_key=None):
+    def __init__(self, api_key=None, reconnect=True, reconnect_delay=1, max_reconnect_delay=60,
+                 ping_interval=30, ping_timeout=10, stale_timeout=60, metrics=None):
         self.api_key = api_key
+        self.metrics = metrics
+        self.reconnect = reconnect
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.ping_interval = ping_interval
+        self.ping_timeout = ping_timeout
+        self.stale_timeout = stale_timeout
         self.rest_client = BinanceRESTAPI(self.api_key)
         self.depth_cache = Depth()
+        self.subscriptions = []
+        self._subscriptions_lock = threading.Lock()
+
+    def _add_subscription(self, subscription):
+        with self._subscriptions_lock:
+            self.subscriptions.append(subscription)
+
+    def _remove_subscription(self, subscription):
+        with self._subscriptions_lock:
+            if subscription in self.subscriptions:
+                self.subscriptions.remove(subscription)
+
+    def close(self, timeout=None):
+        with self._subscriptions_lock:
+            subscriptions = list(self.subscriptions)
+        for subscription in subscriptions:
+            subscription.runner.close()
+        for subscription in subscriptions:
+            subscription.join(timeout)
+
+    def combined_stream(self, **hooks):
+        from .stream import CombinedStream
+        return CombinedStream(self, **hooks)
+
+    def order_books(self, symbols=None, **kwargs):
+        from .book import OrderBookManager
+        return OrderBookManager(self.rest_client, self, symbols, **kwargs)
 
     depth = bind_ws_method(
             path="/{symbol}@depth",
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+class ServerClock(object):
+    def __init__(self, api, smoothing=0.3):
+        self.api = api
+        self.smoothing = smoothing
+        self.offset = 0.0
+        self.rtt = None
+        self.synced = False
+        self._last_date = None
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def now(self):
+        return int(time.time() * 1000 + self.offset)
+
+    def update(self, offset, rtt):
+        with self._lock:
+            if not self.synced:
+                self.offset, self.rtt, self.synced = offset, rtt, True
+            else:
+                self.offset += self.smoothing * (offset - self.offset)
+                self.rtt += self.smoothing * (rtt - self.rtt)
+
+    def record(self, sent, server_time, received):
+        self.update(server_time - (sent + received) * 500, (received - sent) * 1000)
+        return self.offset
+
+    def sync(self):
+        sent = time.time()
+        server_time = self.api.server_time(return_json=True, cache=False)["serverTime"]
+        return self.record(sent, server_time, time.time())
+
+    def update_from_date(self, date, received=None):
+        if not date or date == self._last_date:
+            return
+        self._last_date = date
+
+        from email.utils import parsedate_tz, mktime_tz
+        parsed = parsedate_tz(date)
+        if parsed is None:
+            return
+
+        received_ms = (received or time.time()) * 1000
+        lower = mktime_tz(parsed) * 1000 - received_ms
+        upper = lower + 1000 + (self.rtt or 0)
+        with self._lock:
+            if self.offset < lower:
+                self.offset = lower
+            elif self.offset > upper:
+                self.offset = upper
+
+    def _refresh(self, interval, stopped):
+        while not stopped.is_set():
+            try:
+                self.sync()
+            except Exception as e:
+                logger.warning("Server time sync failed: %s", e)
+            stopped.wait(interval)
+
+    def start(self, interval=60):
+        self.stop()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._refresh, args=(interval, self._stopped))
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
@@ -0,0 +1,36 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+import array as _array
+
+from array import array
+
+INT64 = "i"
+FLOAT64 = "f"
+BOOL = "b"
+
+NUMPY_TYPES = {INT64: "int64", FLOAT64: "float64", BOOL: "bool"}
+
+ARRAY_TYPECODES = {INT64: "q" if "q" in getattr(_array, "typecodes", "") else "l", FLOAT64: "d", BOOL: "b"}
+ARRAY_CASTS = {INT64: int, FLOAT64: float, BOOL: int}
+
+_numpy = []
+
+def get_numpy():
+    if not _numpy:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        _numpy.append(numpy)
+    return _numpy[0]
+
+def column(rows, key, kind, use_numpy=True):
+    numpy = get_numpy() if use_numpy else None
+    if numpy is not None:
+        return numpy.array([row[key] for row in rows], dtype=NUMPY_TYPES[kind])
+    cast = ARRAY_CASTS[kind]
+    return array(ARRAY_TYPECODES[kind], [cast(row[key]) for row in rows])
+
+def columns_from_list(rows, fields, use_numpy=True):
+    return dict([(name, column(rows, key, kind, use_numpy)) for name, key, kind in fields])
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+import collections
+import threading
+import time
+
+DROP_OLDEST = "drop_oldest"
+DROP_NEWEST = "drop_newest"
+BLOCK = "block"
+
+OVERFLOW_POLICIES = [DROP_OLDEST, DROP_NEWEST, BLOCK]
+
+class EventQueue(object):
+    def __init__(self, maxsize=10000, overflow=DROP_OLDEST):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError("overflow must be one of %s" % ", ".join(OVERFLOW_POLICIES))
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.queued = 0
+        self.dropped = 0
+        self._items = collections.deque()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+    def put(self, item, timeout=None):
+        with self._not_full:
+            if len(self._items) >= self.maxsize:
+                if self.overflow == DROP_NEWEST:
+                    self.dropped += 1
+                    return False
+                elif self.overflow == DROP_OLDEST:
+                    self._items.popleft()
+                    self.dropped += 1
+                else:
+                    deadline = None if timeout is None else time.time() + timeout
+                    while len(self._items) >= self.maxsize:
+                        remaining = None if deadline is None else deadline - time.time()
+                        if remaining is not None and remaining <= 0:
+                            self.dropped += 1
+                            return False
+                        self._not_full.wait(remaining)
+            self._items.append(item)
+            self.queued += 1
+            self._not_empty.notify()
+            return True
+
+    def get_batch(self, max_items=None, timeout=None):
+        with self._not_empty:
+            if timeout is None:
+                while not self._items:
+                    self._not_empty.wait()
+            elif not self._items and timeout > 0:
+                self._not_empty.wait(timeout)
+            count = len(self._items) if max_items is None else min(max_items, len(self._items))
+            batch = [self._items.popleft() for _ in range(count)]
+            if batch:
+                self._not_full.notify_all()
+            return batch
+
+    def get(self, timeout=None):
+        batch = self.get_batch(1, timeout)
+        return batch[0] if batch else None
+
+    def __len__(self):
+        return len(self._items)
+
+    def __repr__(self):
+        return "EventQueue(size=%s, queued=%s, dropped=%s)" % (len(self._items), self.queued, self.dropped)
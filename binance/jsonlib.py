@@ -0,0 +1,37 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+import importlib
+import sys
+
+DECODERS = ["orjson", "ujson", "simplejson", "json"]
+
+def _import_decoder(name):
+    module = importlib.import_module(name)
+    return module.loads
+
+def set_json_decoder(decoder=None):
+    global decoder_name, loads
+
+    if callable(decoder):
+        decoder_name, loads = getattr(decoder, "__module__", None) or repr(decoder), decoder
+        return decoder_name
+
+    for name in ([decoder] if decoder else DECODERS):
+        try:
+            loads = _import_decoder(name)
+        except ImportError:
+            if decoder:
+                raise
+            continue
+        decoder_name = name
+        return decoder_name
+
+def __getattr__(name):
+    if name in ("loads", "decoder_name"):
+        set_json_decoder()
+        return globals()[name]
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+if sys.version_info < (3, 7):
+    set_json_decoder()
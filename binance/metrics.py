@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+import bisect
+import re
+import threading
+import time
+
+DEFAULT_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+re_statsd_unsafe = re.compile('[^A-Za-z0-9_-]+')
+
+def response_retries(response):
+    retries = getattr(getattr(response, "raw", None), "retries", None)
+    return len(retries.history) if retries is not None else 0
+
+class Histogram(object):
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q):
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return self.buckets[index] if index < len(self.buckets) else float("inf")
+
+class StatsdSink(object):
+    def __init__(self, host="127.0.0.1", port=8125, prefix="binance"):
+        import socket
+
+        self.address = (host, port)
+        self.prefix = prefix
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+    def _name(self, name, labels):
+        parts = [self.prefix, name] + [re_statsd_unsafe.sub("_", str(value)).strip("_") for key, value in labels]
+        return ".".join([part for part in parts if part])
+
+    def _send(self, line):
+        try:
+            self.socket.sendto(line.encode(), self.address)
+        except (IOError, OSError):
+            pass
+
+    def observe(self, name, value, labels):
+        self._send("%s:%.3f|ms" % (self._name(name, labels), value * 1000))
+
+    def increment(self, name, value, labels):
+        self._send("%s:%s|c" % (self._name(name, labels), value))
+
+class MetricsRegistry(object):
+    def __init__(self, buckets=DEFAULT_BUCKETS, sinks=None):
+        self.buckets = buckets
+        self.sinks = list(sinks or [])
+        self.histograms = {}
+        self.counters = {}
+        self._lock = threading.Lock()
+
+    def observe(self, name, value, **labels):
+        labels = tuple(sorted(labels.items()))
+        with self._lock:
+            histogram = self.histograms.get((name, labels))
+            if histogram is None:
+                histogram = self.histograms[(name, labels)] = Histogram(self.buckets)
+            histogram.observe(value)
+        for sink in self.sinks:
+            sink.observe(name, value, labels)
+
+    def increment(self, name, value=1, **labels):
+        labels = tuple(sorted(labels.items()))
+        with self._lock:
+            self.counters[(name, labels)] = self.counters.get((name, labels), 0) + value
+        for sink in self.sinks:
+            sink.increment(name, value, labels)
+
+    def record_request(self, endpoint, timings, status_code, size=0, retries=0, cached=False):
+        for phase, value in timings.items():
+            self.observe("request_seconds", value, endpoint=endpoint, phase=phase)
+        if cached:
+            self.increment("cache_hits_total", endpoint=endpoint)
+            return
+        self.increment("requests_total", endpoint=endpoint, status=status_code)
+        if size:
+            self.increment("response_bytes_total", size, endpoint=endpoint)
+        if retries:
+            self.increment("request_retries_total", retries, endpoint=endpoint)
+
+    def record_message(self, stream, event_time=None, received=None):
+        self.increment("ws_messages_total", stream=stream)
+        if event_time is not None:
+            lag = (received or time.time()) - event_time / 1000.0
+            self.observe("ws_lag_seconds", max(lag, 0), stream=stream)
+
+    def to_prometheus(self, prefix="binance"):
+        def format_labels(labels, extra=()):
+            pairs = ['%s="%s"' % (key, str(value).replace('"', '\\"')) for key, value in tuple(labels) + tuple(extra)]
+            return "{%s}" % ",".join(pairs) if pairs else ""
+
+        lines = []
+        with self._lock:
+            typed = set()
+            for (name, labels), value in sorted(self.counters.items()):
+                if name not in typed:
+                    typed.add(name)
+                    lines.append("# TYPE %s_%s counter" % (prefix, name))
+                lines.append("%s_%s%s %s" % (prefix, name, format_labels(labels), value))
+
+            for (name, labels), histogram in sorted(self.histograms.items()):
+                if name not in typed:
+                    typed.add(name)
+                    lines.append("# TYPE %s_%s histogram" % (prefix, name))
+                cumulative = 0
+                for bound, count in zip(list(histogram.buckets) + ["+Inf"], histogram.counts):
+                    cumulative += count
+                    lines.append("%s_%s_bucket%s %s" % (prefix, name, format_labels(labels, (("le", bound),)), cumulative))
+                lines.append("%s_%s_sum%s %s" % (prefix, name, format_labels(labels), histogram.sum))
+                lines.append("%s_%s_count%s %s" % (prefix, name, format_labels(labels), histogram.count))
+        return "\n".join(lines) + "\n"
@@ -2,25 +2,106 @@
 # coding=utf-8
 
 import six
+import bisect
+import itertools
 
-def camel_to_underline(camel_format):
+from decimal import Decimal
+
+MAX_CACHED_KEY_SETS = 1024
+
+FIXED_POINT_DECIMALS = 8
+FIXED_POINT_SCALE = 10 ** FIXED_POINT_DECIMALS
+
+_underline_cache = {}
+_key_set_cache = {}
+_field_map_cache = {}
+
+def _camel_to_underline(camel_format):
     underline_format=''
     if isinstance(camel_format, str):
         for _s_ in camel_format:
             underline_format += _s_ if _s_.islower() else '_'+_s_.lower()
     return underline_format
 
+def camel_to_underline(camel_format):
+    try:
+        return _underline_cache[camel_format]
+    except KeyError:
+        underline_format = _underline_cache[camel_format] = _camel_to_underline(camel_format)
+        return underline_format
+    except TypeError:
+        return _camel_to_underline(camel_format)
+
+def underline_keys(entry):
+    keys = tuple(entry)
+    underlined = _key_set_cache.get(keys)
+    if underlined is None:
+        if len(_key_set_cache) >= MAX_CACHED_KEY_SETS:
+            _key_set_cache.clear()
+        underlined = _key_set_cache[keys] = [camel_to_underline(str(key)) for key in keys]
+    return dict(zip(underlined, entry.values()))
+
+def field_map(entry):
+    keys = tuple(entry)
+    fields = _field_map_cache.get(keys)
+    if fields is None:
+        if len(_field_map_cache) >= MAX_CACHED_KEY_SETS:
+            _field_map_cache.clear()
+        fields = _field_map_cache[keys] = dict([(camel_to_underline(str(key)), key) for key in keys])
+    return fields
+
 def sort_dict_in_list(data, sort_key, reverse=False):
-    return sorted(data, key=lambda k: getattr(k, sort_key), reverse=reverse)
+    return sorted(data, key=lambda k: float(getattr(k, sort_key)), reverse=reverse)
+
+def fixed_point(value):
+    if isinstance(value, six.string_types):
+        whole, _, fraction = value.partition(".")
+        return int(whole + fraction[:FIXED_POINT_DECIMALS].ljust(FIXED_POINT_DECIMALS, "0"))
+    return int(round(value * FIXED_POINT_SCALE))
+
+def to_float(value):
+    if isinstance(value, six.integer_types):
+        return float(value) / FIXED_POINT_SCALE
+    return float(value)
+
+NUMBER_FORMATS = {
+    None: None,
+    "float": float,
+    "decimal": Decimal,
+    "fixed": fixed_point,
+}
+
+number_format = None
+to_number = None
+
+def set_number_format(format=None):
+    global number_format, to_number
+
+    if format not in NUMBER_FORMATS:
+        raise ValueError("Unknown number format %r, expected one of %s" % (format, sorted(NUMBER_FORMATS, key=str)))
+    number_format, to_number = format, NUMBER_FORMATS[format]
+    return number_format
+
+def parse_fields(obj, names):
+    for name in names:
+        value = getattr(obj, name, None)
+        if value is not None:
+            setattr(obj, name, to_number(value))
+    return obj
+
+def _levels(cls, rows):
+    if to_number is None:
+        return [cls(row[0], row[1]) for row in rows]
+    return [cls(to_number(row[0]), to_number(row[1])) for row in rows]
 
 class ApiModel(object):
+    __slots__ = ()
     
     @classmethod
     def object_from_dictionary(cls, entry):
         if entry is None:
             return ""
-        entry_str_dict = dict([(camel_to_underline(str(key)), value) for key, value in entry.items()])
-        return cls(**entry_str_dict)
+        return cls(**underline_keys(entry))
 
     def __repr__(self):
         return str(self)
@@ -31,6 +112,75 @@ class ApiModel(object):
         else:
             return unicode(self).encode('utf-8')
 
+class LazyModel(object):
+    __slots__ = ("_entry", "_root_class", "_fields", "_model")
+
+    def __init__(self, entry, root_class, fields):
+        self._entry = entry
+        self._root_class = root_class
+        self._fields = fields
+        self._model = None
+
+    def to_model(self):
+        if self._model is None:
+            self._model = self._root_class.object_from_dictionary(self._entry)
+        return self._model
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        key = self._fields.get(name)
+        if key is None:
+            return getattr(self.to_model(), name)
+        try:
+            value = self._entry[key]
+        except (KeyError, IndexError):
+            return getattr(self.to_model(), name)
+        if to_number is not None and name in getattr(self._root_class, "NUMBER_FIELDS", ()):
+            return to_number(value)
+        return value
+
+    def __reduce__(self):
+        return LazyModel, (self._entry, self._root_class, self._fields)
+
+    def __repr__(self):
+        return repr(self.to_model())
+
+class LazyList(object):
+    def __init__(self, rows, root_class, fields=None):
+        self.rows = rows
+        self.root_class = root_class
+        self._fields = fields
+
+    def fields(self):
+        if self._fields is None:
+            if hasattr(self.root_class, "COLUMNS"):
+                self._fields = dict([(name, key) for name, key, kind in self.root_class.COLUMNS])
+            elif self.rows and isinstance(self.rows[0], dict):
+                self._fields = field_map(self.rows[0])
+            else:
+                self._fields = {}
+        return self._fields
+
+    def models(self):
+        return [self.root_class.object_from_dictionary(row) for row in self.rows]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return LazyList(self.rows[index], self.root_class, self._fields)
+        return LazyModel(self.rows[index], self.root_class, self.fields())
+
+    def __iter__(self):
+        root_class, fields = self.root_class, self.fields()
+        for row in self.rows:
+            yield LazyModel(row, root_class, fields)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __repr__(self):
+        return "LazyList(%s x %d)" % (self.root_class.__name__, len(self.rows))
+
 class Entry(ApiModel):
     def __init__(self, *args, **kwargs):
         for key, value in six.iteritems(kwargs):
@@ -40,6 +190,7 @@ class Entry(ApiModel):
         return "Entry"
 
 class Bid(ApiModel):
+    __slots__ = ("price", "qty")
 
     def __init__(self, price, qty):
         self.price = price
@@ -47,6 +198,8 @@ class Bid(ApiModel):
 
     @classmethod
     def object_from_dictionary(cls, array):
+        if to_number is not None:
+            return Bid(to_number(array[0]), to_number(array[1]))
         new_bid = Bid(array[0], array[1])
         return new_bid
 
@@ -54,12 +207,16 @@ class Bid(ApiModel):
         return "Bid: (%s, %s)" % (self.price, self.qty)
     
 class Ask(ApiModel):
+    __slots__ = ("price", "qty")
+
     def __init__(self, price, qty):
         self.price = price
         self.qty = qty
 
     @classmethod
     def object_from_dictionary(cls, array):
+        if to_number is not None:
+            return Ask(to_number(array[0]), to_number(array[1]))
         new_ask = Ask(array[0], array[1])
         return new_ask
 
@@ -74,18 +231,27 @@ class Depth(ApiModel):
         if asks != None: self.asks = sort_dict_in_list(asks, "price")
 
     def _get_volume(self, data):
-        volume = {
-            "base": 0.0,
-            "qty": 0.0,
-        }
+        if not data:
+            return {"base": 0.0, "qty": 0.0}
 
-        for d in data:
-            volume["base"] = volume["base"] + float(d.price) * float(d.qty)
-            volume["qty"] = volume["qty"] + float(d.qty)
+        if isinstance(data[0].qty, six.string_types):
+            prices = [float(d.price) for d in data]
+            qtys = [float(d.qty) for d in data]
+        else:
+            prices = [d.price for d in data]
+            qtys = [d.qty for d in data]
 
-        volume["base"] = round(volume["base"], 8)
-        volume["qty"] = round(volume["qty"], 8)
-        return volume
+        base = sum([price * qty for price, qty in zip(prices, qtys)])
+        qty = sum(qtys)
+        if isinstance(qtys[0], six.integer_types):
+            base, qty = float(base) / FIXED_POINT_SCALE ** 2, float(qty) / FIXED_POINT_SCALE
+        else:
+            base, qty = float(base), float(qty)
+
+        return {
+            "base": round(base, 8),
+            "qty": round(qty, 8),
+        }
 
     def get_depth_volume(self):
         volume = {}
@@ -99,6 +265,10 @@ class Depth(ApiModel):
     def get_asks_lowest_price(self):
         return self.asks[0].price
 
+    def analytics(self):
+        from .analytics import DepthAnalytics
+        return DepthAnalytics(self)
+
     @classmethod
     def object_from_dictionary(cls, entry):
         new_depth = Depth(last_update_id=entry["lastUpdateId"])
@@ -132,14 +302,16 @@ class DepthCache(object):
             self.asks[ask.price] = ask.qty
 
     def update_bid(self, bid):
-        self.bids[bid.price] = bid.qty
-        if bid.qty == "0.00000000": 
-            del self.bids[bid.price]
+        if float(bid.qty) == 0:
+            self.bids.pop(bid.price, None)
+        else:
+            self.bids[bid.price] = bid.qty
 
     def update_ask(self, ask):
-        self.asks[ask.price] = ask.qty
-        if ask.qty == "0.00000000": 
-            del self.asks[ask.price]
+        if float(ask.qty) == 0:
+            self.asks.pop(ask.price, None)
+        else:
+            self.asks[ask.price] = ask.qty
 
     def update(self, delta):
         if delta.update_id > self.last_update_id:
@@ -159,59 +331,192 @@ class DepthCache(object):
         else:
             return unicode(self).encode('utf-8')
 
+class BookSide(object):
+    def __init__(self, reverse=False):
+        self.reverse = reverse
+        self.keys = []
+        self.levels = {}
+
+    def _key(self, price):
+        return float(price) if self.reverse else -float(price)
+
+    def clear(self):
+        del self.keys[:]
+        self.levels.clear()
+
+    def update(self, level):
+        key = self._key(level.price)
+        if float(level.qty) == 0:
+            if self.levels.pop(key, None) is not None:
+                del self.keys[bisect.bisect_left(self.keys, key)]
+        else:
+            if key not in self.levels:
+                bisect.insort(self.keys, key)
+            self.levels[key] = level
+
+    def best(self):
+        if not self.keys:
+            return None
+        return self.levels[self.keys[-1]]
+
+    def top(self, n):
+        levels = self.levels
+        return (levels[key] for key in itertools.islice(reversed(self.keys), n))
+
+    def __getitem__(self, index):
+        return self.levels[self.keys[-index - 1]]
+
+    def __iter__(self):
+        return self.top(len(self.keys))
+
+    def __len__(self):
+        return len(self.keys)
+
+class OrderBook(object):
+    def __init__(self, depth=None, symbol=None):
+        self.symbol = symbol
+        self.last_update_id = None
+        self.bids = BookSide(reverse=True)
+        self.asks = BookSide()
+        if depth is not None:
+            self.load(depth)
+
+    def load(self, depth):
+        self.last_update_id = depth.last_update_id
+        self.bids.clear()
+        self.asks.clear()
+        for bid in depth.bids: self.bids.update(bid)
+        for ask in depth.asks: self.asks.update(ask)
+
+    def apply(self, delta):
+        self.last_update_id = delta.update_id
+        for bid in delta.bids: self.bids.update(bid)
+        for ask in delta.asks: self.asks.update(ask)
+
+    def update(self, delta):
+        if self.last_update_id is None or delta.update_id > self.last_update_id:
+            self.apply(delta)
+
+    def best_bid(self):
+        return self.bids.best()
+
+    def best_ask(self):
+        return self.asks.best()
+
+    def top_bids(self, n):
+        return self.bids.top(n)
+
+    def top_asks(self, n):
+        return self.asks.top(n)
+
+    def mid_price(self):
+        if not self.bids or not self.asks:
+            return None
+        return (to_float(self.bids.best().price) + to_float(self.asks.best().price)) / 2
+
+    def spread(self):
+        if not self.bids or not self.asks:
+            return None
+        return to_float(self.asks.best().price) - to_float(self.bids.best().price)
+
+    def analytics(self):
+        from .analytics import DepthAnalytics
+        return DepthAnalytics(self)
+
+    def __unicode__(self):
+        return "OrderBook: %s" % self.last_update_id
+
+    def __repr__(self):
+        return str(self)
+
+    def __str__(self):
+        if six.PY3:
+            return self.__unicode__()
+        else:
+            return unicode(self).encode('utf-8')
+
 class Trade(ApiModel):
     def __init__(self, id=None, **kwargs):
         self.id = id
         for key, value in six.iteritems(kwargs):
             setattr(self, key, value)
 
+    NUMBER_FIELDS = ("price", "qty", "commission")
+
+    @classmethod
+    def object_from_dictionary(cls, entry):
+        new_trade = Trade(**underline_keys(entry))
+        if to_number is not None:
+            parse_fields(new_trade, cls.NUMBER_FIELDS)
+
+        return new_trade
+
     def __unicode__(self):
         return "Trade: %s" % self.id
 
 class AggregateTrade(ApiModel):
-    def __init__(self, id=None, **kwargs):
+    __slots__ = ("id", "price", "qty", "first_trade_id", "last_trade_id", "timestamp", "is_maker", "is_best_match")
+
+    def __init__(self, id=None, price=None, qty=None, first_trade_id=None, last_trade_id=None,
+                 timestamp=None, is_maker=None, is_best_match=None):
         self.id = id
-        for key, value in six.iteritems(kwargs):
-            setattr(self, key, value)
+        self.price = price
+        self.qty = qty
+        self.first_trade_id = first_trade_id
+        self.last_trade_id = last_trade_id
+        self.timestamp = timestamp
+        self.is_maker = is_maker
+        self.is_best_match = is_best_match
 
-    @classmethod
-    def object_from_dictionary(cls, entry):
-        new_aggregate_trade = AggregateTrade(id=entry["a"])
+    NUMBER_FIELDS = ("price", "qty")
 
-        new_aggregate_trade.price = entry["p"]
-        new_aggregate_trade.qty = entry["q"]
-        new_aggregate_trade.first_trade_id = entry["f"]
-        new_aggregate_trade.last_trade_id = entry["l"]
-        new_aggregate_trade.timestamp = entry["T"]
-        new_aggregate_trade.is_maker = entry["m"]
-        new_aggregate_trade.is_best_match = entry["M"]
+    COLUMNS = (("id", "a", "i"), ("price", "p", "f"), ("qty", "q", "f"), ("first_trade_id", "f", "i"),
+               ("last_trade_id", "l", "i"), ("timestamp", "T", "i"), ("is_maker", "m", "b"),
+               ("is_best_match", "M", "b"))
 
-        return new_aggregate_trade
+    @classmethod
+    def object_from_dictionary(cls, entry):
+        if to_number is not None:
+            return AggregateTrade(entry["a"], to_number(entry["p"]), to_number(entry["q"]), entry["f"], entry["l"],
+                                  entry["T"], entry["m"], entry["M"])
+        return AggregateTrade(entry["a"], entry["p"], entry["q"], entry["f"], entry["l"],
+                              entry["T"], entry["m"], entry["M"])
 
     def __unicode__(self):
         return "AggregateTrade: %s" % self.id
 
 class Candlestick(ApiModel):
-    def __init__(self, open_time, close_time, **kwargs):
+    __slots__ = ("open_time", "close_time", "open", "high", "low", "close", "volume",
+                 "quote_asset_volume", "number_of_trades", "base_asset_volume", "taker_buy_quote_asset_volume")
+
+    def __init__(self, open_time, close_time, open=None, high=None, low=None, close=None, volume=None,
+                 quote_asset_volume=None, number_of_trades=None, base_asset_volume=None,
+                 taker_buy_quote_asset_volume=None):
         self.open_time = open_time
         self.close_time = close_time
-        for key, value in six.iteritems(kwargs):
-            setattr(self, key, value)
+        self.open = open
+        self.high = high
+        self.low = low
+        self.close = close
+        self.volume = volume
+        self.quote_asset_volume = quote_asset_volume
+        self.number_of_trades = number_of_trades
+        self.base_asset_volume = base_asset_volume
+        self.taker_buy_quote_asset_volume = taker_buy_quote_asset_volume
+
+    COLUMNS = (("open_time", 0, "i"), ("open", 1, "f"), ("high", 2, "f"), ("low", 3, "f"), ("close", 4, "f"),
+               ("volume", 5, "f"), ("close_time", 6, "i"), ("quote_asset_volume", 7, "f"),
+               ("number_of_trades", 8, "i"), ("base_asset_volume", 9, "f"), ("taker_buy_quote_asset_volume", 10, "f"))
+
+    NUMBER_FIELDS = ("open", "high", "low", "close", "volume", "quote_asset_volume", "base_asset_volume",
+                     "taker_buy_quote_asset_volume")
 
     @classmethod
     def object_from_dictionary(cls, entry):
-        new_candlestick = Candlestick(open_time=entry[0], close_time=entry[6])
-        
-        new_candlestick.open = entry[1]
-        new_candlestick.high = entry[2]
-        new_candlestick.low = entry[3]
-        new_candlestick.close = entry[4]
-        new_candlestick.volume = entry[5]
-        new_candlestick.quote_asset_volume = entry[7]
-        new_candlestick.number_of_trades = entry[8]
-        new_candlestick.base_asset_volume = entry[9]
-        new_candlestick.quote_asset_volume = entry[10]
-
+        new_candlestick = Candlestick(entry[0], entry[6], entry[1], entry[2], entry[3], entry[4], entry[5],
+                                      entry[7], entry[8], entry[9], entry[10])
+        if to_number is not None:
+            parse_fields(new_candlestick, cls.NUMBER_FIELDS)
         return new_candlestick
 
     def __unicode__(self):
@@ -224,12 +529,15 @@ class Statistics(ApiModel):
         for key, value in six.iteritems(kwargs):
             setattr(self, key, value)
 
+    NUMBER_FIELDS = ("price_change", "price_change_percent", "weighted_avg_price", "prev_close_price",
+                     "last_price", "bid_price", "ask_price", "open_price", "high_price", "low_price", "volume")
+
     @classmethod
     def object_from_dictionary(cls, entry):
         new_statistics = Statistics(entry["firstId"], entry["lastId"])
-
-        for key, value in six.iteritems(entry):
-            setattr(new_statistics, camel_to_underline(str(key)), value)
+        new_statistics.__dict__.update(underline_keys(entry))
+        if to_number is not None:
+            parse_fields(new_statistics, cls.NUMBER_FIELDS)
 
         return new_statistics
 
@@ -237,6 +545,8 @@ class Statistics(ApiModel):
         return "Statistics: %s-%s" % (self.first_id, self.last_id)
 
 class Price(ApiModel):
+    NUMBER_FIELDS = ("price",)
+
     def __init__(self, price, **kwargs):
         self.price = price
         for key, value in six.iteritems(kwargs):
@@ -244,7 +554,7 @@ class Price(ApiModel):
 
     @classmethod
     def object_from_dictionary(cls, entry):
-        new_price = Price(entry["price"])
+        new_price = Price(entry["price"] if to_number is None else to_number(entry["price"]))
         new_price.symbol = entry["symbol"]
 
         return new_price
@@ -261,8 +571,8 @@ class Ticker(ApiModel):
     @classmethod
     def object_from_dictionary(cls, entry):
         new_ticker = Ticker(entry["symbol"])
-        new_ticker.bid = Bid(entry["bidPrice"], entry["bidQty"])
-        new_ticker.ask = Ask(entry["askPrice"], entry["askQty"])
+        new_ticker.bid = Bid.object_from_dictionary((entry["bidPrice"], entry["bidQty"]))
+        new_ticker.ask = Ask.object_from_dictionary((entry["askPrice"], entry["askQty"]))
 
         return new_ticker
 
@@ -275,12 +585,14 @@ class Order(ApiModel):
         for key, value in six.iteritems(kwargs):
             setattr(self, key, value)
     
+    NUMBER_FIELDS = ("price", "orig_qty", "executed_qty", "stop_price", "iceberg_qty")
+
     @classmethod
     def object_from_dictionary(cls, entry):
         new_order = Order(entry["orderId"])
-        
-        for key, value in six.iteritems(entry):
-            setattr(new_order, camel_to_underline(str(key)), value)
+        new_order.__dict__.update(underline_keys(entry))
+        if to_number is not None:
+            parse_fields(new_order, cls.NUMBER_FIELDS)
 
         return new_order
 
@@ -295,6 +607,14 @@ class Balance(ApiModel):
         for key, value in six.iteritems(kwargs):
             setattr(self, key, value)
 
+    @classmethod
+    def object_from_dictionary(cls, entry):
+        new_balance = Balance(**underline_keys(entry))
+        if to_number is not None:
+            parse_fields(new_balance, ("free", "locked"))
+
+        return new_balance
+
     def __unicode__(self):
         return "Balance: %s" % self.asset
 
@@ -309,9 +629,7 @@ class Account(ApiModel):
     @classmethod
     def object_from_dictionary(cls, entry):
         new_account = Account()
-        
-        for key, value in six.iteritems(entry):
-            setattr(new_account, camel_to_underline(str(key)), value)
+        new_account.__dict__.update(underline_keys(entry))
 
         new_account.balances = []
         new_account.balances_dict = {}
@@ -334,7 +652,7 @@ class Deposit(ApiModel):
         for deposit in entry["depositList"]:
             new_deposit = Deposit()
             new_deposit.insert_time = deposit["insertTime"]
-            new_deposit.amount = deposit["amount"]
+            new_deposit.amount = deposit["amount"] if to_number is None else to_number(deposit["amount"])
             new_deposit.asset = deposit["asset"]
             new_deposit.status = deposit["status"]
             deposit_list.append(new_deposit)
@@ -352,8 +670,8 @@ class Withdraw(ApiModel):
     def object_from_dictionary(cls, entry):
         withdraw_list = []
         for withdraw in entry["withdrawList"]:
-            new_withdraw = WithDraw()
-            new_withdraw.amount = withdraw["amount"]
+            new_withdraw = Withdraw()
+            new_withdraw.amount = withdraw["amount"] if to_number is None else to_number(withdraw["amount"])
             new_withdraw.address = withdraw["address"]
             new_withdraw.asset = withdraw["asset"]
             new_withdraw.apply_time = withdraw["applyTime"]
@@ -366,35 +684,34 @@ class Withdraw(ApiModel):
 
 class DepthUpdateEvent(ApiModel):
     EVENT_TYPE = "depthUpdate" 
+    __slots__ = ("update_id", "first_update_id", "event_type", "event_time", "symbol", "bids", "asks")
 
-    def __init__(self, update_id, **kwargs):
+    def __init__(self, update_id, first_update_id=None, event_type=None, event_time=None, symbol=None,
+                 bids=None, asks=None):
         self.update_id = update_id
-        for key, value in six.iteritems(kwargs):
-            setattr(self, key, value)
+        self.first_update_id = first_update_id
+        self.event_type = event_type
+        self.event_time = event_time
+        self.symbol = symbol
+        self.bids = bids
+        self.asks = asks
 
     @classmethod
     def object_from_dictionary(cls, entry):
-        new_depth_delta = DepthUpdateEvent(entry["u"])
-
-        new_depth_delta.event_type = entry["e"]
-        new_depth_delta.event_time = entry["E"]
-        new_depth_delta.symbol = entry["s"]
-        new_depth_delta.bids = []
-        new_depth_delta.asks = []
-
-        for bid in entry["b"]:
-            new_depth_delta.bids.append(Bid.object_from_dictionary(bid))
-
-        for ask in entry["a"]:
-            new_depth_delta.asks.append(Ask.object_from_dictionary(ask))
-
-        return new_depth_delta
+        return DepthUpdateEvent(entry["u"], entry.get("U"), entry["e"], entry["E"], entry["s"],
+                                _levels(Bid, entry["b"]), _levels(Ask, entry["a"]))
 
     def __unicode__(self):
         return "DepthDeltaEvent: %s" % self.update_id
 
 class KLineEvent(ApiModel):
     EVENT_TYPE = "kline" 
+    __slots__ = ("start_time", "end_time", "event_type", "event_time", "symbol", "interval", "first_trade_id",
+                 "last_trade_id", "open", "close", "high", "low", "volume", "number_of_trades", "is_final",
+                 "quote_volume", "active_buy_volume", "active_buy_quote_volume")
+
+    NUMBER_FIELDS = ("open", "close", "high", "low", "volume", "quote_volume", "active_buy_volume",
+                     "active_buy_quote_volume")
 
     def __init__(self, start_time, end_time, **kwargs):
         self.start_time = start_time
@@ -423,6 +740,8 @@ class KLineEvent(ApiModel):
         new_kline.quote_volume = entry["q"]
         new_kline.active_buy_volume = entry["V"]
         new_kline.active_buy_quote_volume = entry["Q"]
+        if to_number is not None:
+            parse_fields(new_kline, cls.NUMBER_FIELDS)
 
         return new_kline
 
@@ -431,26 +750,28 @@ class KLineEvent(ApiModel):
 
 class AggregateTradeEvent(ApiModel):
     EVENT_TYPE = "aggTrade" 
+    __slots__ = ("event_time", "event_type", "symbol", "price", "qty", "first_breakdown_trade_id",
+                 "last_breakdown_trade_id", "trade_time", "is_maker")
 
-    def __init__(self, event_time, **kwargs):
+    def __init__(self, event_time, event_type=None, symbol=None, price=None, qty=None,
+                 first_breakdown_trade_id=None, last_breakdown_trade_id=None, trade_time=None, is_maker=None):
         self.event_time = event_time
-        for key, value in six.iteritems(kwargs):
-            setattr(self, key, value)
+        self.event_type = event_type
+        self.symbol = symbol
+        self.price = price
+        self.qty = qty
+        self.first_breakdown_trade_id = first_breakdown_trade_id
+        self.last_breakdown_trade_id = last_breakdown_trade_id
+        self.trade_time = trade_time
+        self.is_maker = is_maker
 
     @classmethod
     def object_from_dictionary(cls, entry):
-        new_aggregate_trade = AggregateTradeEvent(event_time=entry["E"])
-
-        new_aggregate_trade.event_type = entry["e"]
-        new_aggregate_trade.symbol = entry["s"]
-        new_aggregate_trade.price = entry["p"]
-        new_aggregate_trade.qty = entry["q"]
-        new_aggregate_trade.first_breakdown_trade_id = entry["f"]
-        new_aggregate_trade.last_breakdown_trade_id = entry["l"]
-        new_aggregate_trade.trade_time = entry["T"]
-        new_aggregate_trade.is_maker = entry["m"]
-
-        return new_aggregate_trade
+        if to_number is not None:
+            return AggregateTradeEvent(entry["E"], entry["e"], entry["s"], to_number(entry["p"]), to_number(entry["q"]),
+                                       entry["f"], entry["l"], entry["T"], entry["m"])
+        return AggregateTradeEvent(entry["E"], entry["e"], entry["s"], entry["p"], entry["q"],
+                                   entry["f"], entry["l"], entry["T"], entry["m"])
 
     def __unicode__(self):
         return "AggregateTradeEvent: %s" % self.event_time
@@ -470,7 +791,10 @@ class OutBoundAccountInfoEvent(ApiModel):
         new_event.event_type = entry["e"]
         new_event.balances = []
         for balance in entry["B"]:
-            new_event.balances.append(Balance(balance["a"], balance["f"], balance["l"]))
+            new_balance = Balance(balance["a"], balance["f"], balance["l"])
+            if to_number is not None:
+                parse_fields(new_balance, ("free", "locked"))
+            new_event.balances.append(new_balance)
 
         return new_event
 
@@ -480,6 +804,9 @@ class OutBoundAccountInfoEvent(ApiModel):
 class ExecutionReportEvent(ApiModel):
     EVENT_TYPE = "executionReport" 
 
+    NUMBER_FIELDS = ("original_quantity", "price", "last_filled_trade_quantity", "filled_trade_accumulated_quantity",
+                     "last_filled_trade_price", "commission")
+
     def __init__(self, event_time, **kwargs):
         self.event_time = event_time
         for key, value in six.iteritems(kwargs):
@@ -510,6 +837,8 @@ class ExecutionReportEvent(ApiModel):
         new_event.trade_time = entry["T"]
         new_event.trade_id = entry["t"]
         new_event.is_maker = entry["m"]
+        if to_number is not None:
+            parse_fields(new_event, cls.NUMBER_FIELDS)
 
         return new_event
 
@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+import time
+
+from functools import partial
+
+from .batch import iter_batch
+
+KLINES_LIMIT = 500
+AGGREGATE_TRADES_LIMIT = 500
+AGGREGATE_TRADES_WINDOW = 60 * 60 * 1000 - 1
+
+INTERVAL_MILLISECONDS = {
+    "1m": 60 * 1000,
+    "3m": 3 * 60 * 1000,
+    "5m": 5 * 60 * 1000,
+    "15m": 15 * 60 * 1000,
+    "30m": 30 * 60 * 1000,
+    "1h": 60 * 60 * 1000,
+    "2h": 2 * 60 * 60 * 1000,
+    "4h": 4 * 60 * 60 * 1000,
+    "6h": 6 * 60 * 60 * 1000,
+    "8h": 8 * 60 * 60 * 1000,
+    "12h": 12 * 60 * 60 * 1000,
+    "1d": 24 * 60 * 60 * 1000,
+    "3d": 3 * 24 * 60 * 60 * 1000,
+    "1w": 7 * 24 * 60 * 60 * 1000,
+    "1M": 28 * 24 * 60 * 60 * 1000,
+}
+
+def now_milliseconds():
+    return int(time.time() * 1000)
+
+def time_windows(start_time, end_time, step):
+    while start_time <= end_time:
+        yield start_time, min(start_time + step - 1, end_time)
+        start_time += step
+
+def _klines_window(client, symbol, interval, limit, start_time, end_time):
+    klines = []
+    while start_time <= end_time:
+        page = client.klines(symbol, interval, limit, start_time, end_time)
+        klines.extend(page)
+        if len(page) < limit or page[-1].open_time + INTERVAL_MILLISECONDS[interval] > end_time:
+            break
+        start_time = page[-1].open_time + 1
+    return klines
+
+def _aggregate_trades_window(client, symbol, limit, start_time, end_time):
+    trades = page = client.aggregate_trades(symbol, start_time=start_time, end_time=end_time, limit=limit)
+    while len(page) == limit:
+        page = [trade for trade in client.aggregate_trades(symbol, from_id=trades[-1].id + 1, limit=limit)
+                if trade.timestamp <= end_time]
+        trades.extend(page)
+    return trades
+
+def _iter_windows(fetch, windows, max_workers):
+    for item in iter_batch(fetch, windows, max_workers=max_workers):
+        if not item.ok:
+            raise item.error
+        yield item.result
+
+def iter_klines(client, symbol, interval, start_time, end_time=None, limit=KLINES_LIMIT, max_workers=4):
+    end_time = end_time or now_milliseconds()
+    step = INTERVAL_MILLISECONDS[interval] * limit
+    fetch = partial(_klines_window, client, symbol, interval, limit)
+
+    last_open_time = None
+    for klines in _iter_windows(fetch, time_windows(start_time, end_time, step), max_workers):
+        for kline in klines:
+            if last_open_time is not None and kline.open_time <= last_open_time:
+                continue
+            last_open_time = kline.open_time
+            yield kline
+
+def iter_aggregate_trades(client, symbol, start_time, end_time=None, limit=AGGREGATE_TRADES_LIMIT, max_workers=4):
+    end_time = end_time or now_milliseconds()
+    fetch = partial(_aggregate_trades_window, client, symbol, limit)
+
+    last_id = None
+    for trades in _iter_windows(fetch, time_windows(start_time, end_time, AGGREGATE_TRADES_WINDOW + 1), max_workers):
+        for trade in trades:
+            if last_id is not None and trade.id <= last_id:
+                continue
+            last_id = trade.id
+            yield trade
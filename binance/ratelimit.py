@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+import threading
+import time
+
+REQUEST_WEIGHT_PER_MINUTE = 1200
+ORDERS_PER_SECOND = 10
+
+class TokenBucket(object):
+    def __init__(self, capacity, interval):
+        self.capacity = capacity
+        self.rate = float(capacity) / interval
+        self.tokens = float(capacity)
+        self.updated = time.time()
+
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self, amount, now):
+        self._refill(now)
+        self.tokens -= amount
+        return -self.tokens / self.rate if self.tokens < 0 else 0
+
+    def consume_to(self, remaining, now):
+        self._refill(now)
+        self.tokens = min(self.tokens, remaining)
+
+class RateLimiter(object):
+    def __init__(self, weight_per_minute=REQUEST_WEIGHT_PER_MINUTE, orders_per_second=ORDERS_PER_SECOND):
+        self.weights = TokenBucket(weight_per_minute, 60)
+        self.orders = TokenBucket(orders_per_second, 1)
+        self.blocked_until = 0
+        self.used_weight = None
+        self._lock = threading.Lock()
+
+    def reserve(self, weight=1, orders=0):
+        with self._lock:
+            now = time.time()
+            wait = max(self.blocked_until - now, 0)
+            wait = max(wait, self.weights.reserve(weight, now))
+            if orders:
+                wait = max(wait, self.orders.reserve(orders, now))
+            return wait
+
+    def acquire(self, weight=1, orders=0):
+        wait = self.reserve(weight, orders)
+        if wait > 0:
+            time.sleep(wait)
+
+    def block(self, seconds):
+        with self._lock:
+            self.blocked_until = max(self.blocked_until, time.time() + seconds)
+
+    def update(self, status_code, headers):
+        used_weight = headers.get("X-MBX-USED-WEIGHT-1M") or headers.get("X-MBX-USED-WEIGHT")
+        if used_weight is not None:
+            with self._lock:
+                self.used_weight = int(used_weight)
+                self.weights.consume_to(self.weights.capacity - self.used_weight, time.time())
+
+        if status_code in (418, 429):
+            retry_after = headers.get("Retry-After")
+            self.block(float(retry_after) if retry_after is not None else 60)
@@ -1,17 +1,23 @@
 #!/usr/bin/env python
 # coding=utf-8
 
-import logging
-import requests
-import websocket
-import simplejson
-import ssl
-import six
-from six.moves.urllib.parse import urlencode
+import sys
 
-from events import Events
+from timeit import default_timer as timer
 
-logging.basicConfig()
+def create_session(pool_connections=10, pool_maxsize=10, max_retries=0, keep_alive=True):
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_connections,
+                          pool_maxsize=pool_maxsize,
+                          max_retries=max_retries)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if not keep_alive:
+        session.headers["Connection"] = "close"
+    return session
 
 class Request(object):
     def __init__(self, api):
@@ -29,77 +35,45 @@ class Request(object):
                                 self._get_base_path(path),
                                 path)
                                 
-    def _full_url_with_params(self, path, params):
-        return (self._full_url(path) +
-                self._full_query_with_params(params))
-
-    def _full_query_with_params(self, params):
-        signature = params.pop("signature", None)
-        params = ("?" + urlencode(params)) if params else ""
-        if signature is not None:
-            params = params + "&signature=" + signature
-        return params
-
-    def _post_body(self, params):
-        signature = params.pop("signature", None)
-        body = list(params.items())
-        if signature is not None:
-            body = body + [("signature", signature)]
-        return body
-
-    def prepare_request(self, method, path, params):
-        url = body = None
+    def prepare_encoded_request(self, method, path, query):
+        body = None
         headers = {}
 
         if method == "GET" or self._is_wapi(path):
-            url = self._full_url_with_params(path, params)
+            url = self._full_url(path) + ("?" + query if query else "")
         else:
-            url = self._full_url(path) 
-            body = self._post_body(params)
+            url = self._full_url(path)
+            body = query
+            headers["Content-Type"] = "application/x-www-form-urlencoded"
 
         return url, method, body, headers
 
-    def make_request(self, url, method="GET", body=None, headers=None):
+    def make_request(self, url, method="GET", body=None, headers=None, weight=1, orders=0, timings=None):
         headers = headers or {}
         if not 'User-Agent' in headers:
             headers.update({"User-Agent": "%s Python Client" % self.api.api_name})
-        if method == "GET":
-            return requests.get(url, headers=headers)
-        elif method == "POST":
-            return requests.post(url, data=body, headers=headers)
-        elif method == "DELETE":
-            return requests.delete(url, data=body, headers=headers)
-        elif method == "PUT":
-            return requests.put(url, data=body, headers=headers)
-
-class WebSocket(Events):
-    __events__ = ['callback']
-
-    def __init__(self, api, callback=None):
-        self.api = api
-        self.callback += callback
-
-    def _full_url(self, path):
-        return "%s://%s:%s%s%s" % (self.api.protocol,
-                                self.api.host,
-                                self.api.port,
-                                self.api.base_path,
-                                path)
-
-    def _on_message(self, ws, message):
-        data = simplejson.loads(message)
-        self.callback(data)
-
-    def _on_error(self, ws, error):
-        raise Exception(error)
-
-    def prepare_request(self, path):
-        url = self._full_url(path)
-
-        return url
-
-    def run_forever(self, url):
-        self.ws = websocket.WebSocketApp(url,
-                                         on_message=self._on_message,
-                                         on_error=self._on_error)
-        self.ws.run_forever(sslopt={"cert_reqs": ssl.CERT_NONE})
+        rate_limiter = self.api.rate_limiter
+        if rate_limiter is not None:
+            started = timer()
+            rate_limiter.acquire(weight, orders)
+            if timings is not None:
+                timings["rate_limit"] = timer() - started
+
+        started = timer()
+        response = self.api.session.request(method, url, data=body, headers=headers, timeout=self.api.timeout)
+        if timings is not None:
+            timings["network"] = timer() - started
+
+        if rate_limiter is not None:
+            rate_limiter.update(response.status_code, response.headers)
+        self.api.clock.update_from_date(response.headers.get("Date"))
+        return response
+
+def __getattr__(name):
+    if name in ("WebSocket", "Subscription"):
+        from . import stream
+        return getattr(stream, name)
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+if sys.version_info < (3, 7):
+    from .stream import WebSocket, Subscription
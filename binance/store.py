@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+import bisect
+import mmap
+import os
+
+from array import array
+
+from .bind import BinanceClientError
+from .columns import get_numpy
+from .models import Candlestick, to_float
+from .paginate import INTERVAL_MILLISECONDS, iter_klines, now_milliseconds
+
+STORE_TYPECODES = {"i": "q", "f": "d"}
+ITEM_SIZE = 8
+APPEND_CHUNK = 1000
+
+class KlineStore(object):
+    def __init__(self, path, client=None):
+        self.path = path
+        self.client = client
+
+    def _directory(self, symbol, interval):
+        return os.path.join(self.path, symbol.upper(), interval)
+
+    def _column_path(self, symbol, interval, name):
+        return os.path.join(self._directory(symbol, interval), name + ".bin")
+
+    def count(self, symbol, interval):
+        sizes = []
+        for name, key, kind in Candlestick.COLUMNS:
+            column_path = self._column_path(symbol, interval, name)
+            sizes.append(os.path.getsize(column_path) if os.path.exists(column_path) else 0)
+        return min(sizes) // ITEM_SIZE
+
+    def _load_column(self, symbol, interval, name, kind, count):
+        typecode = STORE_TYPECODES[kind]
+        numpy = get_numpy()
+        if count == 0:
+            return numpy.zeros(0, dtype=typecode) if numpy is not None else array(typecode)
+
+        column_path = self._column_path(symbol, interval, name)
+        if numpy is not None:
+            return numpy.memmap(column_path, dtype=typecode, mode="r", shape=(count,))
+
+        with open(column_path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), count * ITEM_SIZE, access=mmap.ACCESS_READ)
+        return memoryview(mapped).cast(typecode)
+
+    def read(self, symbol, interval, start_time=None, end_time=None):
+        count = self.count(symbol, interval)
+        columns = dict([(name, self._load_column(symbol, interval, name, kind, count))
+                        for name, key, kind in Candlestick.COLUMNS])
+
+        open_time = columns["open_time"]
+        start = 0 if start_time is None else bisect.bisect_left(open_time, start_time)
+        end = count if end_time is None else bisect.bisect_right(open_time, end_time)
+        if start == 0 and end == count:
+            return columns
+        return dict([(name, values[start:end]) for name, values in columns.items()])
+
+    def last_open_time(self, symbol, interval):
+        count = self.count(symbol, interval)
+        if count == 0:
+            return None
+        with open(self._column_path(symbol, interval, "open_time"), "rb") as f:
+            f.seek((count - 1) * ITEM_SIZE)
+            return array("q", f.read(ITEM_SIZE))[0]
+
+    def _truncate(self, symbol, interval, count):
+        for name, key, kind in Candlestick.COLUMNS:
+            column_path = self._column_path(symbol, interval, name)
+            if os.path.exists(column_path) and os.path.getsize(column_path) != count * ITEM_SIZE:
+                with open(column_path, "r+b") as f:
+                    f.truncate(count * ITEM_SIZE)
+
+    def append(self, symbol, interval, klines):
+        directory = self._directory(symbol, interval)
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        self._truncate(symbol, interval, self.count(symbol, interval))
+
+        last_open_time = self.last_open_time(symbol, interval)
+        klines = [kline for kline in klines if last_open_time is None or kline.open_time > last_open_time]
+        for name, key, kind in Candlestick.COLUMNS:
+            typecode = STORE_TYPECODES[kind]
+            cast = int if kind == "i" else to_float
+            values = array(typecode, [cast(getattr(kline, name)) for kline in klines])
+            with open(self._column_path(symbol, interval, name), "ab") as f:
+                f.write(values.tobytes() if hasattr(values, "tobytes") else values.tostring())
+        return len(klines)
+
+    def sync(self, symbol, interval, start_time=None, end_time=None, **kwargs):
+        now = now_milliseconds()
+        end_time = min(end_time or now, now)
+        last_open_time = self.last_open_time(symbol, interval)
+        if last_open_time is not None:
+            start_time = last_open_time + INTERVAL_MILLISECONDS[interval]
+        elif start_time is None:
+            raise BinanceClientError("start_time is required to sync an empty store")
+
+        appended = 0
+        chunk = []
+        for kline in iter_klines(self.client, symbol, interval, start_time, end_time, **kwargs):
+            if kline.close_time >= now:
+                break
+            chunk.append(kline)
+            if len(chunk) >= APPEND_CHUNK:
+                appended += self.append(symbol, interval, chunk)
+                chunk = []
+        if chunk:
+            appended += self.append(symbol, interval, chunk)
+        return appended
@@ -0,0 +1,287 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+import itertools
+import logging
+import random
+import socket
+import ssl
+import threading
+import time
+
+import six
+import simplejson
+import websocket
+
+from events import Events
+from . import jsonlib
+
+logger = logging.getLogger(__name__)
+
+class WebSocket(Events):
+    __events__ = ['callback', 'on_open', 'on_close', 'on_reconnect', 'on_error']
+
+    def __init__(self, api, callback=None, raw=False, data_timeout=None, **hooks):
+        super(WebSocket, self).__init__()
+        self.api = api
+        self.raw = raw
+        self.data_timeout = data_timeout
+        self.ws = None
+        self.running = False
+        self.reconnects = 0
+        self.message_count = 0
+        self.last_message_time = None
+        self.last_activity_time = None
+        self._attempts = 0
+        self._closed = False
+        self._stopped = threading.Event()
+        self._lock = threading.Lock()
+        self.callback += callback
+        for name, handler in six.iteritems(hooks):
+            if handler is not None:
+                slot = getattr(self, name)
+                slot += handler
+
+    def _full_url(self, path, base_path=None):
+        return "%s://%s:%s%s%s" % (self.api.protocol,
+                                self.api.host,
+                                self.api.port,
+                                self.api.base_path if base_path is None else base_path,
+                                path)
+
+    def _on_message(self, ws, message):
+        self.last_message_time = self.last_activity_time = time.time()
+        self.message_count += 1
+        if self.raw:
+            self.callback(message)
+        else:
+            self.callback(jsonlib.loads(message))
+
+    def _on_heartbeat(self, ws, *args):
+        self.last_activity_time = time.time()
+
+    def _on_open(self, ws):
+        self.last_message_time = self.last_activity_time = time.time()
+        self._attempts = 0
+        self.on_open(self)
+        if self.reconnects:
+            self.on_reconnect(self)
+
+    def _on_close(self, ws, *args):
+        self.on_close(self)
+
+    def _on_error(self, ws, error):
+        logger.warning("WebSocket error on %s: %s", ws.url, error)
+        self.on_error(self, error)
+
+    def _backoff(self):
+        delay = min(self.api.max_reconnect_delay, self.api.reconnect_delay * 2 ** self._attempts)
+        self._attempts += 1
+        return delay * random.uniform(0.5, 1.0)
+
+    def _is_stale(self, now):
+        stale_timeout, data_timeout = self.api.stale_timeout, self.data_timeout
+        if stale_timeout and now - self.last_activity_time > stale_timeout:
+            return "no frames or pongs for %ss" % stale_timeout
+        if data_timeout and now - self.last_message_time > data_timeout:
+            return "no data for %ss" % data_timeout
+
+    def _watchdog(self, stopped):
+        while not stopped.wait(1):
+            ws = self.ws
+            if ws is None or self.last_message_time is None or self.last_activity_time is None:
+                continue
+            reason = self._is_stale(time.time())
+            if reason is not None:
+                logger.warning("WebSocket %s stale (%s), reconnecting", ws.url, reason)
+                self.last_message_time = self.last_activity_time = None
+                self._close_socket(ws)
+
+    def _close_socket(self, ws):
+        try:
+            ws.close()
+        except (socket.error, websocket.WebSocketException) as e:
+            logger.debug("Error closing WebSocket %s: %s", ws.url, e)
+
+    def prepare_request(self, path):
+        url = self._full_url(path)
+
+        return url
+
+    def prepare_combined_request(self, streams):
+        path = ("?streams=" + "/".join(streams)) if streams else ""
+        return self._full_url(path, base_path=self.api.combined_base_path)
+
+    def send(self, data):
+        self.ws.send(simplejson.dumps(data))
+
+    def close(self):
+        with self._lock:
+            if self.running:
+                self.running = False
+                self._stopped.set()
+            else:
+                self._closed = True
+        if self.ws is not None:
+            self._close_socket(self.ws)
+
+    def run_forever(self, url):
+        with self._lock:
+            if self._closed:
+                self._closed = False
+                return
+            self.running = True
+            self._stopped = stopped = threading.Event()
+        if self.api.stale_timeout or self.data_timeout:
+            watchdog = threading.Thread(target=self._watchdog, args=(stopped,))
+            watchdog.daemon = True
+            watchdog.start()
+
+        while self.running:
+            self.ws = websocket.WebSocketApp(url() if callable(url) else url,
+                                             on_open=self._on_open,
+                                             on_message=self._on_message,
+                                             on_error=self._on_error,
+                                             on_close=self._on_close,
+                                             on_ping=self._on_heartbeat,
+                                             on_pong=self._on_heartbeat)
+            self.ws.run_forever(sslopt={"cert_reqs": ssl.CERT_NONE},
+                                ping_interval=self.api.ping_interval,
+                                ping_timeout=self.api.ping_timeout)
+            if not self.running or not self.api.reconnect:
+                break
+
+            delay = self._backoff()
+            logger.info("WebSocket %s disconnected, reconnecting in %.1fs", self.ws.url, delay)
+            if stopped.wait(delay):
+                break
+            self.reconnects += 1
+
+        with self._lock:
+            self.running = False
+            stopped.set()
+
+class Subscription(object):
+    def __init__(self, api, runner):
+        self.api = api
+        self.runner = runner
+        self.thread = threading.Thread(target=self._run)
+        self.thread.daemon = True
+
+    def _run(self):
+        try:
+            self.runner.run_forever()
+        finally:
+            self.api._remove_subscription(self)
+
+    @property
+    def message_counts(self):
+        return self.runner.message_counts
+
+    @property
+    def queue(self):
+        return getattr(self.runner, "queue", None)
+
+    def start(self):
+        self.api._add_subscription(self)
+        self.thread.start()
+        return self
+
+    def stop(self, timeout=None):
+        self.runner.close()
+        self.join(timeout)
+
+    def join(self, timeout=None):
+        self.thread.join(timeout)
+
+    def is_alive(self):
+        return self.thread.is_alive()
+
+class CombinedStream(object):
+    def __init__(self, api, data_timeout=None, **hooks):
+        self.api = api
+        self.methods = {}
+        self.message_counts = {}
+        self.websocket = WebSocket(self.api, self._callback, data_timeout=data_timeout, **hooks)
+        self.websocket.on_open += self._on_open
+        self.websocket.on_close += self._on_close
+        self._subscribed = set()
+        self._connected = False
+        self._request_ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    @property
+    def streams(self):
+        return list(self.methods)
+
+    def _send(self, action, streams):
+        self.websocket.send({"method": action, "params": list(streams), "id": next(self._request_ids)})
+
+    def subscribe(self, subscription, *args, **kwargs):
+        from .bind import BinanceWebSocketClientError
+
+        method_class = getattr(subscription, "method_class", None)
+        if method_class is None:
+            raise BinanceWebSocketClientError("%r is not a WebSocket subscription" % subscription)
+
+        method = method_class(self.api, *args, **kwargs)
+        if method.return_raw:
+            raise BinanceWebSocketClientError("return_raw is not supported on combined streams")
+        name = method.stream_name
+        with self._lock:
+            self.methods[name] = method
+            if self._connected and name not in self._subscribed:
+                self._subscribed.add(name)
+                self._send("SUBSCRIBE", [name])
+        return name
+
+    def unsubscribe(self, name):
+        from .bind import BinanceWebSocketClientError
+
+        with self._lock:
+            if self.methods.pop(name, None) is None:
+                raise BinanceWebSocketClientError("Stream %s is not subscribed" % name)
+            if self._connected and name in self._subscribed:
+                self._subscribed.discard(name)
+                self._send("UNSUBSCRIBE", [name])
+
+    def _on_open(self, websocket):
+        with self._lock:
+            self._connected = True
+            missing = [name for name in self.methods if name not in self._subscribed]
+            stale = [name for name in self._subscribed if name not in self.methods]
+            self._subscribed.difference_update(stale)
+            self._subscribed.update(missing)
+            if missing:
+                self._send("SUBSCRIBE", missing)
+            if stale:
+                self._send("UNSUBSCRIBE", stale)
+
+    def _on_close(self, websocket):
+        with self._lock:
+            self._connected = False
+
+    def _callback(self, content_obj):
+        if "stream" not in content_obj:
+            return
+
+        name = content_obj["stream"]
+        method = self.methods.get(name)
+        if method is not None:
+            self.message_counts[name] = self.message_counts.get(name, 0) + 1
+            method._callback(content_obj["data"])
+
+    def close(self):
+        self.websocket.close()
+
+    def start(self):
+        return Subscription(self.api, self).start()
+
+    def _prepare_url(self):
+        with self._lock:
+            self._connected = False
+            self._subscribed = set(self.methods)
+            return self.websocket.prepare_combined_request(sorted(self._subscribed))
+
+    def run_forever(self):
+        self.websocket.run_forever(self._prepare_url)
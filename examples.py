@@ -2,7 +2,7 @@
 # coding=utf-8
 
 from binance.client import BinanceRESTAPI, BinanceWebSocketAPI
-from binance.models import DepthCache
+from binance.models import OrderBook
 
 api_key = "YOUR API KEY"
 secret_key = "YOUR SECRET KEY"
@@ -136,13 +136,14 @@ for withdraw in withdraw_history:
 ws_client = BinanceWebSocketAPI(api_key) 
 
 # WebSocket for depth
-from binance.models import DepthCache
+from binance.models import OrderBook
 
-depth_cache = DepthCache(rest_client.depth("BNBBTC"))
+order_book = OrderBook(rest_client.depth("BNBBTC"))
 
 def on_update(delta):
-    depth_cache.update(delta)
-    for bid in depth_cache.bids:
+    order_book.update(delta)
+    print order_book.best_bid(), order_book.best_ask()
+    for bid in order_book.top_bids(5):
         print bid.price, bid.qty
     
 ws_client.depth("BNBBTC", callback=on_update)
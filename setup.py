@@ -5,7 +5,9 @@ setup(name="python-binance-api",
       version="1.1.0",
       description="Binance API client",
       license="MIT",
-      install_requires=["simplejson","requests","six", "websocket-client", "Events"],
+      install_requires=["simplejson","requests","six", "websocket-client", "Events",
+                        'futures; python_version < "3"'],
+      extras_require={"json": ["orjson"], "numpy": ["numpy"]},
       author="cnfuyu",
       author_email="cnfuyu@gmail.com",
       url="http://github.com/cnfuyu/python-binance-api",